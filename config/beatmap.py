@@ -4,8 +4,65 @@ AUDIO PROCESSING: Synchronizes falling objects with music beats
 Creates musical drum patterns instead of random chaos
 """
 
-import random
-from typing import List, Tuple
+import functools
+import numpy as np
+from typing import Iterator, List, Tuple
+from config.constants import INSTRUMENTS, INSTRUMENT_ID
+
+# Shared generator - seeded once per session, batched draws per beatmap
+_rng = np.random.default_rng()
+
+
+class Beatmap:
+    """
+    Beatmap stored as parallel read-only NumPy arrays (struct-of-arrays)
+    - times: note timestamps in seconds (float64, sorted ascending)
+    - ids: instrument IDs (int8, see config.constants.INSTRUMENT_ID)
+    """
+
+    def __init__(self, times: np.ndarray, ids: np.ndarray):
+        """
+        Initialize beatmap from parallel arrays
+
+        Args:
+            times: Sorted note timestamps in seconds
+            ids: Instrument ID per note
+        """
+        self.times = np.asarray(times, dtype=np.float64)
+        self.ids = np.asarray(ids, dtype=np.int8)
+
+        # Immutable once built, so the arrays can be shared without copies
+        self.times.flags.writeable = False
+        self.ids.flags.writeable = False
+
+    @classmethod
+    def from_pairs(cls, pairs: List[Tuple[float, str]]) -> 'Beatmap':
+        """
+        Build beatmap from (timestamp, instrument) tuples
+
+        Args:
+            pairs: List of (timestamp, instrument) tuples
+
+        Returns:
+            Beatmap sorted by timestamp
+        """
+        times = np.array([t for t, _ in pairs], dtype=np.float64)
+        ids = np.array([INSTRUMENT_ID[i] for _, i in pairs], dtype=np.int8)
+        order = np.argsort(times, kind='stable')
+        return cls(times[order], ids[order])
+
+    def to_pairs(self) -> List[Tuple[float, str]]:
+        """Convert back to a list of (timestamp, instrument) tuples"""
+        return list(self)
+
+    def __len__(self) -> int:
+        """Number of notes"""
+        return len(self.times)
+
+    def __iter__(self) -> Iterator[Tuple[float, str]]:
+        """Iterate as (timestamp, instrument) tuples"""
+        for t, i in zip(self.times.tolist(), self.ids.tolist()):
+            yield t, INSTRUMENTS[i]
 
 
 class BeatmapGenerator:
@@ -40,6 +97,15 @@ class BeatmapGenerator:
         Returns:
             List of (timestamp, instrument) tuples
         """
+        return self.generate_beatmap().to_pairs()
+
+    def generate_beatmap(self) -> Beatmap:
+        """
+        Generate complete beatmap as arrays (no per-note Python tuples)
+
+        Returns:
+            Beatmap sorted by timestamp
+        """
         if self.pattern_type == 'simple':
             return self._generate_simple_pattern()
         elif self.pattern_type == 'smart':
@@ -49,39 +115,24 @@ class BeatmapGenerator:
         else:
             return self._generate_smart_pattern()
 
-    def _generate_simple_pattern(self) -> List[Tuple[float, str]]:
+    def _generate_simple_pattern(self) -> Beatmap:
         """
         Simple repeating pattern: K-S-H (Kick-Snare-HiHat)
         Easy to follow, very predictable
         Uses moderate intervals (1.5-1.8 seconds)
         """
-        beatmap = []
         pattern = ['kick', 'snare', 'hihat']
-        pattern_length = len(pattern)
 
         # Use 3.5x beat intervals for comfortable spacing (1.75 seconds at 120 BPM)
         note_interval = self.beat_interval * 3.5
-        num_notes = int(self.duration / note_interval)
-
-        for i in range(num_notes):
-            timestamp = i * note_interval
-            instrument = pattern[i % pattern_length]
-
-            # Small variation
-            if random.random() < self.variation:
-                instrument = random.choice(['kick', 'snare', 'hihat'])
-
-            beatmap.append((timestamp, instrument))
 
-        return beatmap
+        return self._build_pattern(pattern, note_interval)
 
-    def _generate_smart_pattern(self) -> List[Tuple[float, str]]:
+    def _generate_smart_pattern(self) -> Beatmap:
         """
         Smart drum pattern following typical drum rhythm
         MEDIUM difficulty - moderate spacing (1.5 seconds)
         """
-        beatmap = []
-
         # Simplified pattern for MEDIUM
         base_pattern = [
             'kick',
@@ -92,30 +143,15 @@ class BeatmapGenerator:
             'hihat'
         ]
 
-        pattern_length = len(base_pattern)
         note_interval = self.beat_interval * 3  # 1.5 seconds at 120 BPM
 
-        num_notes = int(self.duration / note_interval)
-
-        for i in range(num_notes):
-            timestamp = i * note_interval
-            instrument = base_pattern[i % pattern_length]
-
-            # Add variation
-            if random.random() < self.variation:
-                instrument = random.choice(['kick', 'snare', 'hihat'])
+        return self._build_pattern(base_pattern, note_interval)
 
-            beatmap.append((timestamp, instrument))
-
-        return beatmap
-
-    def _generate_complex_pattern(self) -> List[Tuple[float, str]]:
+    def _generate_complex_pattern(self) -> Beatmap:
         """
         Complex pattern - HARD difficulty
         Faster spacing (around 1 second)
         """
-        beatmap = []
-
         # Complex pattern for HARD
         base_pattern = [
             'kick', 'snare', 'hihat',
@@ -123,22 +159,32 @@ class BeatmapGenerator:
             'hihat', 'kick', 'snare'
         ]
 
-        pattern_length = len(base_pattern)
         note_interval = self.beat_interval * 2  # Around 1 second at 120 BPM
 
-        num_notes = int(self.duration / note_interval)
+        return self._build_pattern(base_pattern, note_interval)
 
-        for i in range(num_notes):
-            timestamp = i * note_interval
-            instrument = base_pattern[i % pattern_length]
+    def _build_pattern(self, pattern: List[str], note_interval: float) -> Beatmap:
+        """
+        Lay a repeating pattern over the duration (vectorized with NumPy)
+
+        Args:
+            pattern: Instrument sequence to repeat
+            note_interval: Seconds between notes
+
+        Returns:
+            Beatmap with evenly spaced notes
+        """
+        num_notes = int(self.duration / note_interval)
 
-            # Higher variation for complex mode
-            if random.random() < self.variation:
-                instrument = random.choice(['kick', 'snare', 'hihat'])
+        timestamps = np.arange(num_notes, dtype=np.float64) * note_interval
+        pattern_ids = np.array([INSTRUMENT_ID[name] for name in pattern], dtype=np.int8)
+        ids = pattern_ids[np.arange(num_notes) % len(pattern_ids)]
 
-            beatmap.append((timestamp, instrument))
+        # Variation: randomly substitute a fraction of the notes
+        mask = _rng.random(num_notes) < self.variation
+        ids[mask] = _rng.integers(0, len(INSTRUMENTS), size=int(mask.sum()), dtype=np.int8)
 
-        return beatmap
+        return Beatmap(timestamps, ids)
 
     def get_pattern_for_loop(self, loop_duration: float = 9.0) -> List[Tuple[float, str]]:
         """
@@ -166,42 +212,36 @@ class BeatmapGenerator:
 
 # ===== PRESET BEATMAPS FOR 9-SECOND LOOP =====
 
-def get_preset_beatmap_easy() -> List[Tuple[float, str]]:
-    """Preset easy beatmap for 9-second loop"""
+@functools.lru_cache(maxsize=None)
+def _generate_preset(pattern_type: str, variation: float) -> Tuple[Tuple[float, str], ...]:
+    """Generate a preset once per session (cached, immutable)"""
     generator = BeatmapGenerator(
         duration=9.0,
         bpm=120,
-        pattern_type='simple',
-        variation=0.1
+        pattern_type=pattern_type,
+        variation=variation
     )
-    return generator.generate()
+    return tuple(generator.generate())
+
+
+def get_preset_beatmap_easy() -> List[Tuple[float, str]]:
+    """Preset easy beatmap for 9-second loop"""
+    return list(_generate_preset('simple', 0.1))
 
 
 def get_preset_beatmap_medium() -> List[Tuple[float, str]]:
     """Preset medium beatmap for 9-second loop"""
-    generator = BeatmapGenerator(
-        duration=9.0,
-        bpm=120,
-        pattern_type='smart',
-        variation=0.3
-    )
-    return generator.generate()
+    return list(_generate_preset('smart', 0.3))
 
 
 def get_preset_beatmap_hard() -> List[Tuple[float, str]]:
     """Preset hard beatmap for 9-second loop"""
-    generator = BeatmapGenerator(
-        duration=9.0,
-        bpm=120,
-        pattern_type='complex',
-        variation=0.5
-    )
-    return generator.generate()
+    return list(_generate_preset('complex', 0.5))
 
 
 # ===== UTILITY FUNCTIONS =====
 
-def loop_beatmap(beatmap: List[Tuple[float, str]], num_loops: int, loop_duration: float) -> List[Tuple[float, str]]:
+def loop_beatmap(beatmap: Beatmap, num_loops: int, loop_duration: float) -> Beatmap:
     """
     Repeat a beatmap pattern for multiple loops
 
@@ -213,16 +253,15 @@ def loop_beatmap(beatmap: List[Tuple[float, str]], num_loops: int, loop_duration
     Returns:
         Extended beatmap with all loops
     """
-    extended = []
-
-    for loop_index in range(num_loops):
-        offset = loop_index * loop_duration
-        for timestamp, instrument in beatmap:
-            extended.append((timestamp + offset, instrument))
+    offsets = np.repeat(np.arange(num_loops, dtype=np.float64) * loop_duration, len(beatmap))
+    times = np.tile(beatmap.times, num_loops) + offsets
+    ids = np.tile(beatmap.ids, num_loops)
 
-    return extended
+    return Beatmap(times, ids)
 
 
-def filter_beatmap_by_time(beatmap: List[Tuple[float, str]], start_time: float, end_time: float) -> List[Tuple[float, str]]:
-    """Filter beatmap to only include notes within time range"""
-    return [(t, i) for t, i in beatmap if start_time <= t <= end_time]
+def filter_beatmap_by_time(beatmap: Beatmap, start_time: float, end_time: float) -> Beatmap:
+    """Filter beatmap to only include notes within time range (binary search)"""
+    lo = np.searchsorted(beatmap.times, start_time, side='left')
+    hi = np.searchsorted(beatmap.times, end_time, side='right')
+    return Beatmap(beatmap.times[lo:hi], beatmap.ids[lo:hi])
@@ -3,6 +3,8 @@ Game Constants - Colors, Positions, Zones
 For Multimedia Processing: Image/Video Overlay Configuration
 """
 
+import numpy as np
+
 # ===== SCREEN CONFIGURATION =====
 SCREEN_WIDTH = 1280
 SCREEN_HEIGHT = 720
@@ -13,6 +15,9 @@ FPS = 60
 CAMERA_WIDTH = 1280   # HD 720p width
 CAMERA_HEIGHT = 720   # HD 720p height
 CAMERA_FLIP_HORIZONTAL = True
+CAMERA_FPS = 30       # Requested capture rate (render loop runs independently)
+CAMERA_FALLBACK_WIDTH = 640   # Used when the camera reports less than the requested
+CAMERA_FALLBACK_HEIGHT = 480  # size or FPS (e.g. raw 720p saturating USB2)
 
 # Alternative resolutions (uncomment if needed):
 # Full HD 1080p: CAMERA_WIDTH = 1920, CAMERA_HEIGHT = 1080
@@ -116,6 +121,14 @@ TARGET_Y_POSITIONS = {
     'snare': OBJECT_TARGET_Y_SIDE
 }
 
+# Small-int instrument IDs for array-based (NumPy) note storage
+INSTRUMENTS = ('kick', 'snare', 'hihat')
+INSTRUMENT_ID = {name: idx for idx, name in enumerate(INSTRUMENTS)}
+
+# Per-instrument positions indexed by instrument ID
+TRACK_X_ARR = np.array([KICK_TRACK_X, SNARE_TRACK_X, HIHAT_TRACK_X], dtype=np.int32)
+TARGET_Y_ARR = np.array([OBJECT_TARGET_Y_SIDE, OBJECT_TARGET_Y_SIDE, OBJECT_TARGET_Y_CENTER], dtype=np.int32)
+
 
 # Hit detection Y range (vertical tolerance)
 # Using side target as reference (most common)
@@ -159,6 +172,7 @@ SHAKE_INTENSITY = 5
 ASSET_PATH = "assets"
 IMAGE_PATH = f"{ASSET_PATH}/image"
 AUDIO_PATH = f"{ASSET_PATH}/audio"
+MODEL_PATH = f"{ASSET_PATH}/models"
 
 # Image assets
 IMAGE_KICK = f"{IMAGE_PATH}/kick.png"
@@ -171,10 +185,21 @@ AUDIO_KICK = f"{AUDIO_PATH}/kick.wav"
 AUDIO_SNARE = f"{AUDIO_PATH}/snare-drum-341273.mp3"
 AUDIO_HIHAT = f"{AUDIO_PATH}/open-hi-hat-431740.mp3"
 
+# MediaPipe Tasks models (GameSettings.MEDIAPIPE_GPU / USE_INT8_MODELS)
+MODEL_HAND_LANDMARKER = f"{MODEL_PATH}/hand_landmarker.task"
+MODEL_HAND_LANDMARKER_INT8 = f"{MODEL_PATH}/hand_landmarker_int8.task"
+MODEL_FACE_LANDMARKER = f"{MODEL_PATH}/face_landmarker.task"
+
 # ===== MEDIAPIPE HAND DETECTION SETTINGS (IMAGE PROCESSING) =====
 HAND_DETECTION_CONFIDENCE = 0.7
-HAND_TRACKING_CONFIDENCE = 0.5
+HAND_TRACKING_CONFIDENCE = 0.4  # Lower = palm detector reruns less often
 MAX_HANDS = 2
 
+# Inference resolution - MediaPipe runs on a downscaled copy of the frame
+# The frame is fit inside this box keeping its aspect ratio (never upscaled)
+# Landmarks are normalized [0, 1] so they map back to full resolution as-is
+INFERENCE_WIDTH = 640
+INFERENCE_HEIGHT = 360
+
 # Hand landmark indices for bounding box calculation
 HAND_BBOX_PADDING = 20  # Pixels to expand bounding box
@@ -45,17 +45,17 @@ class DifficultySettings:
         'color': (231, 76, 60)          # Red
     }
 
-    @staticmethod
-    def get_difficulty(level='MEDIUM'):
-        """Get difficulty settings by level name"""
-        if level == 'EASY':
-            return DifficultySettings.EASY
-        elif level == 'MEDIUM':
-            return DifficultySettings.MEDIUM
-        elif level == 'HARD':
-            return DifficultySettings.HARD
-        else:
-            return DifficultySettings.MEDIUM
+    # Level name -> settings lookup table
+    _LEVELS = {
+        'EASY': EASY,
+        'MEDIUM': MEDIUM,
+        'HARD': HARD
+    }
+
+    @classmethod
+    def get_difficulty(cls, level='MEDIUM'):
+        """Get difficulty settings by level name (unknown names fall back to MEDIUM)"""
+        return cls._LEVELS.get(level, cls.MEDIUM)
 
 
 class GameSettings:
@@ -64,11 +64,15 @@ class GameSettings:
     # Game duration
     GAME_DURATION = 60  # seconds (will loop 9-second beat ~6-7 times)
 
+    # Hi-Hat input (a difficulty may override it with a 'use_chin' key)
+    USE_CHIN = True  # Hi-Hat by chin (False: fingertip, no face mesh)
+
     # Audio settings (AUDIO PROCESSING)
+    AUDIO_ENABLED = True  # False skips mixer init (silent mode)
     AUDIO_FREQUENCY = 44100
     AUDIO_SIZE = -16
     AUDIO_CHANNELS = 2
-    AUDIO_BUFFER = 512
+    AUDIO_BUFFER = 1024  # ~23 ms at 44.1 kHz: fewer underruns under tracking load, hit sounds stay tight
 
     # Main beat loop (9 seconds)
     BEAT_DURATION = 9.0
@@ -80,15 +84,23 @@ class GameSettings:
     ENABLE_SCREEN_SHAKE = True
 
     # Hand tracking (IMAGE PROCESSING)
-    SHOW_HAND_LANDMARKS = False  # Show MediaPipe skeleton
     SHOW_HAND_BBOX = True        # Show bounding boxes
     HAND_BBOX_COLOR = (0, 255, 0)  # Green
     HAND_BBOX_THICKNESS = 3
+    FACE_MESH_INTERVAL = 2       # Run face mesh every Nth frame (chin moves slowly)
+    MOTION_WAKE_THRESHOLD = 0.5  # Mean gray change (0-255) below which detection is skipped
+    DARK_FRAME_LEVEL = 8         # Mean brightness (0-255) below which a frame is blank (0 = off)
+    MEDIAPIPE_GPU = False        # Tasks API on the GPU delegate (needs assets/models/*.task)
+    USE_INT8_MODELS = False      # Tasks API on CPU with the int8 hand model (FP32 if missing)
 
     # Camera feed (VIDEO PROCESSING)
     CAMERA_ALPHA = 0.6           # Transparency of camera overlay
     CAMERA_BLUR = False          # Blur background slightly
     CAMERA_BRIGHTNESS = 1.0      # Brightness adjustment
+    CAMERA_RESIZE_INTERP = None  # cv2.INTER_* for the feed resize (None = nearest near 1:1, else bilinear)
+
+    # Frame pacing
+    BUSY_LOOP_TIMING = False     # tick_busy_loop: exact pacing, but spins one CPU core
 
     # Debug mode
     DEBUG_MODE = False           # Show FPS, hitboxes, etc.
@@ -14,7 +14,6 @@ Course: Sistem/Teknologi Multimedia - IF25-40305
 """
 
 import sys
-from src.game_manager import GameManager
 
 
 def main():
@@ -38,6 +37,9 @@ def main():
     print("\nInitializing game...\n")
 
     try:
+        # Imported here so the banner shows before pygame/OpenCV/MediaPipe load
+        from src.game_manager import GameManager
+
         # Create and run game
         game = GameManager()
         game.run()
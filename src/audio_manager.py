@@ -5,7 +5,7 @@ Handles: Main beat looping, instrument sound effects, audio synchronization
 
 import pygame
 import os
-from config.constants import AUDIO_PATH, AUDIO_MAIN_BEAT, AUDIO_KICK, AUDIO_SNARE, AUDIO_HIHAT
+from config.constants import AUDIO_PATH, AUDIO_MAIN_BEAT, AUDIO_KICK, AUDIO_SNARE, AUDIO_HIHAT, INSTRUMENTS
 from config.settings import GameSettings
 
 
@@ -17,15 +17,26 @@ class AudioManager:
     - Hit/Miss feedback sounds
     """
 
-    def __init__(self):
-        """Initialize pygame mixer and load all sounds"""
-        # Initialize audio with high quality settings
-        pygame.mixer.init(
-            frequency=GameSettings.AUDIO_FREQUENCY,
-            size=GameSettings.AUDIO_SIZE,
-            channels=GameSettings.AUDIO_CHANNELS,
-            buffer=GameSettings.AUDIO_BUFFER
-        )
+    def __init__(self, no_audio: bool = False):
+        """
+        Load all sounds (the mixer starts on first load, not at import)
+
+        Args:
+            no_audio: Skip mixer initialization entirely, all playback is a no-op
+        """
+        self.no_audio = no_audio
+        self._mixer_ready = False
+
+        # Dedicated playback channel per instrument (set up with the mixer)
+        self._channels = {}
+
+        # Hit feedback sound per rating, volume baked in
+        self._hit_sounds = {}
+
+        # Hot-path tables indexed by HitResult.instrument_id / rating_index
+        # (no string keys): (channel, sound) per instrument, sound per rating
+        self._instrument_voices = [None] * len(INSTRUMENTS)
+        self._rating_sounds = [None] * 4
 
         # Sound effects dictionary
         self.sounds = {}
@@ -37,11 +48,49 @@ class AudioManager:
         self.music_playing = False
         self.music_paused = False
 
+    def _ensure_mixer(self) -> bool:
+        """
+        Initialize pygame mixer on first use
+
+        Returns:
+            True if the mixer is available
+        """
+        if self.no_audio:
+            return False
+
+        if not self._mixer_ready:
+            try:
+                # Initialize audio with high quality settings
+                pygame.mixer.init(
+                    frequency=GameSettings.AUDIO_FREQUENCY,
+                    size=GameSettings.AUDIO_SIZE,
+                    channels=GameSettings.AUDIO_CHANNELS,
+                    buffer=GameSettings.AUDIO_BUFFER
+                )
+                self._mixer_ready = True
+
+                # Reserve one channel per instrument so a drum never steals
+                # another's voice; feedback sounds use the remaining channels
+                pygame.mixer.set_num_channels(8)
+                pygame.mixer.set_reserved(len(INSTRUMENTS))
+                self._channels = {
+                    instrument: pygame.mixer.Channel(idx)
+                    for idx, instrument in enumerate(INSTRUMENTS)
+                }
+            except pygame.error as e:
+                print(f"[WARNING] Audio disabled, mixer init failed: {e}")
+                self.no_audio = True
+
+        return self._mixer_ready
+
     def _load_sounds(self):
         """
         Load all sound files
         AUDIO PROCESSING: Load and prepare audio files for playback
         """
+        if not self._ensure_mixer():
+            return
+
         try:
             # Load instrument sounds as pygame.mixer.Sound objects
             # These can be played simultaneously (polyphonic)
@@ -66,6 +115,24 @@ class AudioManager:
             self.sounds['hit'] = self.sounds.get('hihat')  # Can replace with dedicated sound
             self.sounds['miss'] = None  # Can add a "thud" or error sound
 
+            # One copy of the hit sound per rating (each Sound holds its own
+            # copy of the short sample, with its own volume) so playback
+            # never touches the instrument's volume
+            if self.sounds['hit']:
+                raw = self.sounds['hit'].get_raw()
+                for hit_type, volume in (('perfect', 1.0), ('good', 0.8), ('ok', 0.6)):
+                    self._hit_sounds[hit_type] = pygame.mixer.Sound(buffer=raw)
+                    self._hit_sounds[hit_type].set_volume(volume)
+
+            # Rating order matches CollisionDetector (PERFECT, GOOD, OK, MISS)
+            self._rating_sounds = [
+                self._hit_sounds.get(hit_type) for hit_type in ('perfect', 'good', 'ok')
+            ] + [None]
+            self._instrument_voices = [
+                (self._channels[instrument], self.sounds[instrument]) if self.sounds.get(instrument) else None
+                for instrument in INSTRUMENTS
+            ]
+
             print("[OK] All audio files loaded successfully")
 
         except Exception as e:
@@ -76,6 +143,9 @@ class AudioManager:
         Load main background beat (9-second loop)
         AUDIO PROCESSING: Prepare main music track for seamless looping
         """
+        if not self._ensure_mixer():
+            return False
+
         try:
             if os.path.exists(AUDIO_MAIN_BEAT):
                 pygame.mixer.music.load(AUDIO_MAIN_BEAT)
@@ -97,27 +167,28 @@ class AudioManager:
         Args:
             loops: -1 for infinite loop, or number of loops
         """
-        if not self.music_playing:
+        if self._mixer_ready and not self.music_playing:
             pygame.mixer.music.play(loops)
             self.music_playing = True
             print("Main beat started (looping)")
 
     def stop_main_beat(self):
         """Stop the main beat music"""
-        pygame.mixer.music.stop()
+        if self._mixer_ready:
+            pygame.mixer.music.stop()
         self.music_playing = False
         self.music_paused = False
         print("[STOP] Main beat stopped")
 
     def pause_main_beat(self):
         """Pause the main beat"""
-        if self.music_playing and not self.music_paused:
+        if self._mixer_ready and self.music_playing and not self.music_paused:
             pygame.mixer.music.pause()
             self.music_paused = True
 
     def resume_main_beat(self):
         """Resume the main beat"""
-        if self.music_playing and self.music_paused:
+        if self._mixer_ready and self.music_playing and self.music_paused:
             pygame.mixer.music.unpause()
             self.music_paused = False
 
@@ -129,8 +200,31 @@ class AudioManager:
         Args:
             instrument: 'kick', 'snare', or 'hihat'
         """
-        if instrument in self.sounds and self.sounds[instrument]:
-            self.sounds[instrument].play()
+        sound = self.sounds.get(instrument)
+        if sound:
+            self._channels[instrument].play(sound)
+
+    def play_instrument_by_id(self, instrument_id: int):
+        """
+        Play instrument sound effect by instrument ID (hit hot path)
+
+        Args:
+            instrument_id: Index into INSTRUMENTS
+        """
+        voice = self._instrument_voices[instrument_id]
+        if voice:
+            voice[0].play(voice[1])
+
+    def play_hit_sound_by_rating(self, rating_index: int):
+        """
+        Play feedback sound by rating index (hit hot path)
+
+        Args:
+            rating_index: 0 = PERFECT, 1 = GOOD, 2 = OK (3 = MISS is silent)
+        """
+        sound = self._rating_sounds[rating_index]
+        if sound:
+            sound.play()
 
     def play_hit_sound(self, hit_type: str = 'good'):
         """
@@ -140,16 +234,9 @@ class AudioManager:
         Args:
             hit_type: 'perfect', 'good', or 'ok'
         """
-        if 'hit' in self.sounds and self.sounds['hit']:
-            # Can vary pitch/volume based on hit quality
-            volume = {
-                'perfect': 1.0,
-                'good': 0.8,
-                'ok': 0.6
-            }.get(hit_type, 0.8)
-
-            sound = self.sounds['hit']
-            sound.set_volume(volume)
+        # Unknown ratings fall back to the 'good' volume
+        sound = self._hit_sounds.get(hit_type) or self._hit_sounds.get('good')
+        if sound:
             sound.play()
 
     def play_miss_sound(self):
@@ -167,7 +254,8 @@ class AudioManager:
         Args:
             volume: 0.0 to 1.0
         """
-        pygame.mixer.music.set_volume(max(0.0, min(1.0, volume)))
+        if self._mixer_ready:
+            pygame.mixer.music.set_volume(max(0.0, min(1.0, volume)))
 
     def set_sfx_volume(self, volume: float):
         """
@@ -188,14 +276,16 @@ class AudioManager:
         Returns:
             Current music position in ms
         """
-        if self.music_playing:
+        if self._mixer_ready and self.music_playing:
             return pygame.mixer.music.get_pos()
         return 0
 
     def cleanup(self):
         """Stop all audio and cleanup"""
         self.stop_main_beat()
-        pygame.mixer.quit()
+        if self._mixer_ready:
+            pygame.mixer.quit()
+            self._mixer_ready = False
         print("[OK] Audio manager cleaned up")
 
 
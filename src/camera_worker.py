@@ -0,0 +1,380 @@
+"""
+Camera Worker - VIDEO/IMAGE PROCESSING Pipeline
+Captures camera frames and runs hand detection on background threads
+Each stage keeps only its newest output so the game loop never blocks
+
+Threads rather than processes: grab/retrieve, cv2 resize/cvtColor and the
+MediaPipe graph all release the GIL while they run, so capture, inference
+and rendering already overlap on separate cores. The Python left on the
+worker threads is a few dict builds per frame, and a subprocess would add
+frame copies into shared memory plus a second MediaPipe/camera owner.
+"""
+
+import threading
+import time
+import cv2
+from config.constants import SCREEN_WIDTH, SCREEN_HEIGHT
+from config.settings import GameSettings
+
+# Weight of the newest sample in the latency moving averages
+LATENCY_SMOOTHING = 0.1
+
+# Thumbnail size used to measure motion between camera frames
+THUMBNAIL_SIZE = (32, 18)
+
+
+class CameraWorker(threading.Thread):
+    """
+    Background camera capture thread
+    VIDEO PROCESSING: Single-slot frame buffer, stale frames are overwritten
+    The driver queue is drained with grab() continuously; a frame is only
+    decoded with retrieve() once the consumer has asked for the next one
+    """
+
+    def __init__(self, camera):
+        """
+        Initialize camera worker
+
+        Args:
+            camera: Opened cv2.VideoCapture instance
+        """
+        super().__init__(daemon=True)
+        self.camera = camera
+
+        # Single-slot buffer (newest frame wins)
+        # frame_id is the grab sequence number, so gaps mean dropped frames
+        self.latest = None
+        self.frame_id = 0
+        self.lock = threading.Lock()
+
+        # Frames pulled from the driver / actually decoded
+        self.frames_grabbed = 0
+        self.frames_decoded = 0
+
+        # Set by the consumer when it wants the next frame decoded
+        self.frame_wanted = threading.Event()
+        self.frame_wanted.set()
+
+        # Moving-average capture latency (grab + retrieve) in milliseconds
+        self.capture_ms = 0.0
+
+        # Signals consumers that a new frame is ready
+        self.new_frame = threading.Event()
+
+        # Shutdown signal
+        self.stop_event = threading.Event()
+
+    def run(self):
+        """
+        Capture loop - runs until stop() is called
+        The capture is released here, on this thread, so release() never
+        races a grab() that is still blocked on a stalled device
+        """
+        try:
+            self._capture_loop()
+        finally:
+            self.camera.release()
+
+    def _capture_loop(self):
+        """Grab/retrieve frames into the single-slot buffer"""
+        last_log = time.perf_counter()
+
+        while not self.stop_event.is_set():
+            start = time.perf_counter()
+
+            # grab() waits for the next frame, retrieve() decodes it
+            if not self.camera.grab():
+                # Camera hiccup, back off briefly instead of spinning
+                time.sleep(0.005)
+                continue
+            self.frames_grabbed += 1
+
+            # Nobody is waiting for a frame: drop it without decoding
+            if not self.frame_wanted.is_set():
+                continue
+            self.frame_wanted.clear()
+
+            ret, frame = self.camera.retrieve()
+            if not ret:
+                continue
+
+            elapsed_ms = (time.perf_counter() - start) * 1000.0
+            self.capture_ms += LATENCY_SMOOTHING * (elapsed_ms - self.capture_ms)
+
+            self.frames_decoded += 1
+            with self.lock:
+                self.latest = frame
+                self.frame_id = self.frames_grabbed
+            self.new_frame.set()
+
+            # Periodic capture/drop report to verify the dropping policy
+            if GameSettings.DEBUG_MODE:
+                now = time.perf_counter()
+                if now - last_log >= 5.0:
+                    dropped = self.frames_grabbed - self.frames_decoded
+                    print(f"[DEBUG] Camera: {self.frames_grabbed} grabbed, {dropped} dropped")
+                    last_log = now
+
+    def get_latest(self):
+        """
+        Get newest captured frame without blocking
+
+        Returns:
+            Tuple of (frame_id, frame), frame is None until first capture
+        """
+        with self.lock:
+            return self.frame_id, self.latest
+
+    def request_frame(self):
+        """Ask the capture loop to decode the next grabbed frame"""
+        self.frame_wanted.set()
+
+    def stop(self):
+        """
+        Signal the capture loop to exit and wait for it
+
+        Returns:
+            True if the thread exited (camera released), False if grab() is
+            still blocked; the thread then releases the camera when it returns
+        """
+        self.stop_event.set()
+        if self.is_alive():
+            self.join(timeout=1.0)
+        return not self.is_alive()
+
+
+class Detections:
+    """
+    One inference result converted to game coordinates
+    Published as a whole so the game thread always sees a consistent snapshot
+    """
+
+    __slots__ = (
+        'frame_id', 'frame', 'fingertips', 'fingertips_visual',
+        'chin', 'chin_visual', 'fingertip_velocities', 'chin_velocity'
+    )
+
+    def __init__(self, frame_id, frame, fingertips, fingertips_visual,
+                 chin, chin_visual, fingertip_velocities, chin_velocity):
+        """
+        Initialize detection snapshot
+
+        Args:
+            frame_id: Camera grab sequence number of the source frame
+            frame: Unmirrored BGR camera frame the detection ran on
+            fingertips: Fingertip zones for COLLISION (camera X)
+            fingertips_visual: Fingertip positions for VISUAL (matches mirrored video)
+            chin: Chin zone for COLLISION (camera X), or None
+            chin_visual: Chin position for VISUAL, or None
+            fingertip_velocities: Per-hand speed in pixels per camera frame
+            chin_velocity: Chin speed in pixels per camera frame
+        """
+        self.frame_id = frame_id
+        self.frame = frame
+        self.fingertips = fingertips
+        self.fingertips_visual = fingertips_visual
+        self.chin = chin
+        self.chin_visual = chin_visual
+        self.fingertip_velocities = fingertip_velocities
+        self.chin_velocity = chin_velocity
+
+
+class InferenceWorker(threading.Thread):
+    """
+    Background hand/face detection thread
+    IMAGE PROCESSING: Runs MediaPipe on the newest camera frame while the
+    main thread renders, converts the landmarks to game coordinates and
+    velocities, and publishes a Detections snapshot to a single-slot buffer
+    """
+
+    def __init__(self, camera_worker: CameraWorker, hand_tracker):
+        """
+        Initialize inference worker
+
+        Args:
+            camera_worker: CameraWorker providing frames
+            hand_tracker: HandTracker used for detection
+        """
+        super().__init__(daemon=True)
+        self.camera_worker = camera_worker
+        self.hand_tracker = hand_tracker
+
+        # Single-slot result buffer holding the newest Detections
+        self.result_slot = None
+        self.result_id = 0
+        self.lock = threading.Lock()
+
+        # Moving-average detection latency in milliseconds
+        self.inference_ms = 0.0
+
+        # Detection only runs while gameplay needs it (see set_enabled)
+        self.enabled = threading.Event()
+        self.use_face = True
+
+        # Shutdown signal
+        self.stop_event = threading.Event()
+
+    def run(self):
+        """Inference loop - runs until stop() is called"""
+        last_frame_id = 0
+        last_detected_id = 0
+        last_thumbnail = None
+
+        while not self.stop_event.is_set():
+            # Idle outside gameplay: no MediaPipe work, no frame decoding
+            if not self.enabled.wait(timeout=0.1):
+                last_frame_id = 0
+                last_detected_id = 0
+                last_thumbnail = None
+                continue
+
+            # Wait for capture thread instead of spinning
+            if not self.camera_worker.new_frame.wait(timeout=0.1):
+                continue
+            self.camera_worker.new_frame.clear()
+
+            frame_id, frame = self.camera_worker.get_latest()
+            if frame is None or frame_id == last_frame_id:
+                continue
+
+            last_frame_id = frame_id
+
+            # Decode the next frame while this one is being processed
+            self.camera_worker.request_frame()
+
+            # Scene has not moved since the last detection: landmarks would be
+            # the same, so keep the positions and report no motion
+            thumbnail = self.frame_thumbnail(frame)
+            if last_thumbnail is not None and self.result_slot is not None:
+                motion = cv2.norm(thumbnail, last_thumbnail, cv2.NORM_L1) / thumbnail.size
+                if motion <= GameSettings.MOTION_WAKE_THRESHOLD:
+                    self.publish(frame_id, self.still_detections(frame_id, frame))
+                    continue
+            last_thumbnail = thumbnail
+
+            # Camera frames since the previous detection (>1 = frames dropped or still)
+            frames_elapsed = frame_id - last_detected_id if last_detected_id else 1
+            last_detected_id = frame_id
+
+            start = time.perf_counter()
+            frame, hand_results, face_results = self.hand_tracker.process_frame(frame, self.use_face)
+            elapsed_ms = (time.perf_counter() - start) * 1000.0
+            self.inference_ms += LATENCY_SMOOTHING * (elapsed_ms - self.inference_ms)
+
+            detections = self.build_detections(
+                frame_id, frame, hand_results, face_results, frames_elapsed
+            )
+            self.publish(frame_id, detections)
+
+    def publish(self, frame_id: int, detections: Detections):
+        """Replace the single-slot result with a newer snapshot"""
+        with self.lock:
+            self.result_slot = detections
+            self.result_id = frame_id
+
+    @staticmethod
+    def frame_thumbnail(frame):
+        """
+        Cheap motion probe of a camera frame
+        IMAGE PROCESSING: Area-averaged grayscale thumbnail (averaging also
+        suppresses sensor noise)
+
+        Args:
+            frame: BGR frame from the camera
+
+        Returns:
+            uint8 grayscale thumbnail of THUMBNAIL_SIZE
+        """
+        thumb = cv2.resize(frame, THUMBNAIL_SIZE, interpolation=cv2.INTER_AREA)
+        return cv2.cvtColor(thumb, cv2.COLOR_BGR2GRAY)
+
+    def still_detections(self, frame_id, frame) -> Detections:
+        """
+        Snapshot for a frame where nothing moved: previous positions, zero speed
+        (a stale speed would keep counting a resting hand as a hit)
+
+        Args:
+            frame_id: Camera grab sequence number
+            frame: Unmirrored BGR camera frame
+
+        Returns:
+            Detections snapshot
+        """
+        prev = self.result_slot
+        return Detections(
+            frame_id, frame, prev.fingertips, prev.fingertips_visual,
+            prev.chin, prev.chin_visual, dict.fromkeys(prev.fingertip_velocities, 0.0), 0.0
+        )
+
+    def build_detections(self, frame_id, frame, hand_results, face_results,
+                         frames_elapsed: int = 1) -> Detections:
+        """
+        Convert MediaPipe results into game coordinates and velocities
+        IMAGE PROCESSING: Velocity tracking state lives in the hand tracker and
+        is only touched from this thread
+
+        Args:
+            frame_id: Camera grab sequence number
+            frame: Unmirrored BGR camera frame the detection ran on
+            hand_results: MediaPipe hand results
+            face_results: MediaPipe face results
+            frames_elapsed: Camera frames since the previous detection
+
+        Returns:
+            Detections snapshot
+        """
+        tracker = self.hand_tracker
+
+        # Positions for COLLISION (camera X) and VISUAL (mirrored, matches video)
+        fingertip_positions = tracker.get_fingertip_positions(hand_results, SCREEN_WIDTH, SCREEN_HEIGHT)
+        fingertip_visuals = tracker.get_fingertip_visuals(hand_results, SCREEN_WIDTH, SCREEN_HEIGHT)
+        chin_position = tracker.get_chin_position(face_results, SCREEN_WIDTH, SCREEN_HEIGHT)
+        chin_visual = tracker.get_chin_visual(face_results, SCREEN_WIDTH, SCREEN_HEIGHT)
+
+        # Calculate velocities for gesture detection
+        fingertip_velocities, chin_velocity = tracker.calculate_velocities(
+            fingertip_positions, chin_position, frames_elapsed
+        )
+
+        # Update velocity tracking for next frame
+        tracker.update_velocity_tracking()
+
+        return Detections(
+            frame_id, frame, fingertip_positions, fingertip_visuals,
+            chin_position, chin_visual, fingertip_velocities, chin_velocity
+        )
+
+    def get_latest(self):
+        """
+        Get newest detection result without blocking
+
+        Returns:
+            Tuple of (result_id, Detections), result is None until first detection
+        """
+        with self.lock:
+            return self.result_id, self.result_slot
+
+    def set_enabled(self, enabled: bool, use_face: bool = True):
+        """
+        Start or pause detection
+
+        Args:
+            enabled: True while gameplay consumes detections
+            use_face: Run face mesh for the chin lane
+        """
+        self.use_face = use_face
+        if enabled:
+            self.enabled.set()
+        else:
+            self.enabled.clear()
+
+    def stop(self):
+        """
+        Signal the inference loop to exit and wait for it
+        No join timeout: the loop polls stop_event every 0.1 s, so the wait is
+        bounded by one inference, and the tracker is never closed or reused
+        while process_frame is still running
+        """
+        self.stop_event.set()
+        if self.is_alive():
+            self.join()
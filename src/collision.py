@@ -4,13 +4,19 @@ Determines when hands successfully hit falling objects
 Calculates hit accuracy (PERFECT, GOOD, OK, MISS)
 """
 
+import bisect
+import numpy as np
 from typing import Optional, Tuple
+from config.constants import INSTRUMENTS, INSTRUMENT_ID
 
 
 class HitResult:
     """Result of a hit attempt"""
 
-    def __init__(self, success: bool, rating: str, points: int, instrument: str):
+    __slots__ = ('success', 'rating', 'points', 'instrument', 'rating_index', 'instrument_id')
+
+    def __init__(self, success: bool, rating: str, points: int, instrument: str,
+                 rating_index: int, instrument_id: int):
         """
         Initialize hit result
 
@@ -19,11 +25,15 @@ class HitResult:
             rating: 'PERFECT', 'GOOD', 'OK', or 'MISS'
             points: Points earned
             instrument: Instrument that was hit
+            rating_index: Rating as an index (0 = PERFECT ... 3 = MISS)
+            instrument_id: Instrument as an ID (see INSTRUMENT_ID)
         """
         self.success = success
         self.rating = rating
         self.points = points
         self.instrument = instrument
+        self.rating_index = rating_index
+        self.instrument_id = instrument_id
 
 
 class CollisionDetector:
@@ -55,6 +65,22 @@ class CollisionDetector:
             'MISS': 0
         }
 
+        # Sorted distance thresholds -> rating index (bisect lookup table)
+        self._thresholds = (perfect_window, good_window, ok_window)
+        self._ratings = ('PERFECT', 'GOOD', 'OK', 'MISS')
+        self._points = tuple(self.score_values[rating] for rating in self._ratings)
+
+        # Scratch table: active flag per instrument ID (see check_zone)
+        self._lane_active = np.zeros(len(INSTRUMENTS), dtype=bool)
+
+        # Feedback (message, color) per rating index
+        self._feedback = (
+            ('PERFECT!', (46, 204, 113)),   # Green
+            ('GOOD!', (52, 152, 219)),      # Blue
+            ('OK', (241, 196, 15)),         # Yellow
+            ('MISS', (231, 76, 60))         # Red
+        )
+
     def check_hit(self, falling_object, hand_in_lane: bool) -> Optional[HitResult]:
         """
         Check if a falling object was hit
@@ -76,13 +102,14 @@ class CollisionDetector:
         distance = abs(falling_object.get_distance_from_target())
 
         # Determine hit rating based on distance
-        rating = self._calculate_rating(distance)
+        rating_index = bisect.bisect_left(self._thresholds, distance)
 
-        if rating == 'MISS':
-            return None  # Not close enough
+        if rating_index == 3:
+            return None  # Not close enough (MISS)
 
         # Calculate points
-        points = self.score_values[rating]
+        rating = self._ratings[rating_index]
+        points = self._points[rating_index]
 
         # Mark object as hit
         falling_object.mark_hit()
@@ -91,7 +118,9 @@ class CollisionDetector:
             success=True,
             rating=rating,
             points=points,
-            instrument=falling_object.instrument
+            instrument=falling_object.instrument,
+            rating_index=rating_index,
+            instrument_id=INSTRUMENT_ID[falling_object.instrument]
         )
 
     def _calculate_rating(self, distance: float) -> str:
@@ -104,14 +133,7 @@ class CollisionDetector:
         Returns:
             Rating string: 'PERFECT', 'GOOD', 'OK', or 'MISS'
         """
-        if distance <= self.perfect_window:
-            return 'PERFECT'
-        elif distance <= self.good_window:
-            return 'GOOD'
-        elif distance <= self.ok_window:
-            return 'OK'
-        else:
-            return 'MISS'
+        return self._ratings[bisect.bisect_left(self._thresholds, distance)]
 
     def check_multiple_objects(self, objects: list, active_lanes: dict) -> list:
         """
@@ -138,6 +160,54 @@ class CollisionDetector:
 
         return hit_results
 
+    def check_zone(self, falling_objects, active_lanes: dict) -> list:
+        """
+        Vectorized collision check over the falling object arrays
+        Rates every hit-zone candidate in one pass and only builds
+        HitResult objects for actual hits
+
+        Args:
+            falling_objects: FallingObjectManager instance
+            active_lanes: Dict of {instrument: hand_label} for active lanes
+
+        Returns:
+            List of HitResult objects
+        """
+        # No lane touched this tick: nothing can be hit
+        if not active_lanes:
+            return []
+
+        indices, distances, instrument_ids = falling_objects.zone_view()
+        if not len(indices):
+            return []
+
+        # Hand must be in the lane of the object's instrument (lookup table by ID)
+        lane_active = self._lane_active
+        lane_active.fill(False)
+        for instrument in active_lanes:
+            lane_active[INSTRUMENT_ID[instrument]] = True
+        in_lane = lane_active[instrument_ids]
+
+        # Rating index per candidate: 0 = PERFECT ... 3 = MISS
+        rating_indices = np.digitize(distances, self._thresholds, right=True)
+        hits = in_lane & (rating_indices < 3)
+
+        falling_objects.mark_hit(indices[hits])
+
+        return [
+            HitResult(
+                success=True,
+                rating=self._ratings[rating_index],
+                points=self._points[rating_index],
+                instrument=INSTRUMENTS[instrument_id],
+                rating_index=rating_index,
+                instrument_id=instrument_id
+            )
+            for rating_index, instrument_id in zip(
+                rating_indices[hits].tolist(), instrument_ids[hits].tolist()
+            )
+        ]
+
     def get_timing_feedback(self, distance: float) -> Tuple[str, tuple]:
         """
         Get visual feedback for timing
@@ -148,13 +218,4 @@ class CollisionDetector:
         Returns:
             Tuple of (message, color)
         """
-        rating = self._calculate_rating(distance)
-
-        feedback_map = {
-            'PERFECT': ('PERFECT!', (46, 204, 113)),   # Green
-            'GOOD': ('GOOD!', (52, 152, 219)),          # Blue
-            'OK': ('OK', (241, 196, 15)),               # Yellow
-            'MISS': ('MISS', (231, 76, 60))             # Red
-        }
-
-        return feedback_map.get(rating, ('', (255, 255, 255)))
+        return self._feedback[bisect.bisect_left(self._thresholds, distance)]
@@ -5,17 +5,34 @@ Synchronized with audio beats
 """
 
 import pygame
+import numpy as np
 from typing import Tuple
+from config.beatmap import Beatmap
+from config.settings import GameSettings
 from config.constants import (
+    INSTRUMENTS,
+    INSTRUMENT_ID,
+    TRACK_X_ARR,
+    TARGET_Y_ARR,
     OBJECT_SIZE,
     OBJECT_SPAWN_Y,
-    TRACK_POSITIONS,
-    TARGET_Y_POSITIONS,
+    SCREEN_WIDTH,
     IMAGE_KICK,
     IMAGE_SNARE,
     IMAGE_HIHAT
 )
 
+# Per-instrument lookup tables indexed by instrument ID (see INSTRUMENT_ID)
+_IMAGE_PATHS = (IMAGE_KICK, IMAGE_SNARE, IMAGE_HIHAT)
+_TRACK_X = tuple(TRACK_X_ARR.tolist())
+_TARGET_Y = tuple(TARGET_Y_ARR.tolist())
+
+# Falling object state bitflags (FallingObjectManager.state)
+SPAWNED = 1
+HIT = 2
+MISSED = 4
+DEAD = 8
+
 
 class FallingObject:
     """
@@ -23,6 +40,102 @@ class FallingObject:
     Moves from top to bottom at constant speed
     """
 
+    # Fixed attribute set: no per-instance __dict__ (hundreds of instances)
+    __slots__ = (
+        'instrument', 'falling_speed', 'x', 'y', 'size', 'visual_x',
+        'target_y', 'miss_y', 'spawn_time', 'is_spawned', 'is_hit',
+        'is_missed', 'is_dead', 'image', 'alpha', 'scale'
+    )
+
+    # Scaled instrument images shared by all objects (loaded once per instrument)
+    _IMAGE_CACHE = {}
+
+    # Hit fade-out: per-frame growth and alpha loss
+    FADE_SCALE_STEP = 0.05
+    FADE_ALPHA_STEP = 15
+
+    # Pre-rendered fade-out frames per instrument (scale + alpha baked in)
+    _FADE_CACHE = {}
+
+    # Pixels past the target line before an unhit note counts as missed
+    MISS_MARGIN = 100
+
+    # Fallback circle colors when an instrument image is missing
+    _FALLBACK_COLORS = {
+        'kick': (74, 144, 226),
+        'snare': (255, 107, 53),
+        'hihat': (255, 215, 0)
+    }
+
+    @classmethod
+    def _get_image(cls, instrument: str):
+        """
+        Load, convert and scale an instrument image once and cache it
+        If the image cannot be loaded, a colored circle is pre-rendered instead
+
+        Args:
+            instrument: 'kick', 'snare', or 'hihat'
+
+        Returns:
+            Scaled pygame Surface
+        """
+        if instrument not in cls._IMAGE_CACHE:
+            try:
+                image = pygame.image.load(_IMAGE_PATHS[INSTRUMENT_ID[instrument]]).convert_alpha()
+                image = pygame.transform.scale(image, (OBJECT_SIZE, OBJECT_SIZE))
+            except:
+                print(f"Could not load image for {instrument}")
+
+                # Fallback: colored circle drawn once
+                image = pygame.Surface((OBJECT_SIZE, OBJECT_SIZE), pygame.SRCALPHA)
+                color = cls._FALLBACK_COLORS.get(instrument, (255, 255, 255))
+                pygame.draw.circle(image, color, (OBJECT_SIZE // 2, OBJECT_SIZE // 2), OBJECT_SIZE // 2)
+                image = image.convert_alpha()
+
+            cls._IMAGE_CACHE[instrument] = image
+
+        return cls._IMAGE_CACHE[instrument]
+
+    @classmethod
+    def preload(cls):
+        """
+        Load all instrument images and fade frames up front
+        Call after pygame.display.set_mode() so convert_alpha() can match the
+        display pixel format
+        """
+        for instrument in INSTRUMENTS:
+            cls._get_fade_frames(instrument)
+
+    @classmethod
+    def _get_fade_frames(cls, instrument: str) -> list:
+        """
+        Build the hit fade-out ladder once per instrument
+
+        Frame k is the image grown by k * FADE_SCALE_STEP with alpha
+        255 - k * FADE_ALPHA_STEP baked into its pixels.
+
+        Args:
+            instrument: 'kick', 'snare', or 'hihat'
+
+        Returns:
+            List of pygame Surfaces indexed by fade step
+        """
+        if instrument not in cls._FADE_CACHE:
+            image = cls._get_image(instrument)
+            num_steps = -(-255 // cls.FADE_ALPHA_STEP)  # Alpha reaches 0 after this many steps
+
+            frames = []
+            for step in range(num_steps):
+                size = int(OBJECT_SIZE * (1.0 + step * cls.FADE_SCALE_STEP))
+                frame = pygame.transform.smoothscale(image, (size, size))
+                alpha = 255 - step * cls.FADE_ALPHA_STEP
+                frame.fill((255, 255, 255, alpha), None, pygame.BLEND_RGBA_MULT)
+                frames.append(frame)
+
+            cls._FADE_CACHE[instrument] = frames
+
+        return cls._FADE_CACHE[instrument]
+
     def __init__(self, instrument: str, target_time: float, falling_speed: float):
         """
         Initialize falling object
@@ -36,16 +149,17 @@ class FallingObject:
         self.falling_speed = falling_speed
 
         # Position
-        self.x = TRACK_POSITIONS[instrument]
+        instrument_id = INSTRUMENT_ID[instrument]
+        self.x = _TRACK_X[instrument_id]
         self.y = OBJECT_SPAWN_Y
         self.size = OBJECT_SIZE
 
         # Calculate visual X position (inverted for display)
-        from config.constants import SCREEN_WIDTH
         self.visual_x = SCREEN_WIDTH - self.x - self.size
 
         # Get target Y for this instrument
-        self.target_y = TARGET_Y_POSITIONS[instrument]
+        self.target_y = _TARGET_Y[instrument_id]
+        self.miss_y = self.target_y + self.MISS_MARGIN
 
         # Calculate spawn time: spawn early so object reaches target at target_time
         # Distance = target_y - OBJECT_SPAWN_Y
@@ -60,19 +174,8 @@ class FallingObject:
         self.is_missed = False
         self.is_dead = False  # Should be removed
 
-        # Load image
-        image_map = {
-            'kick': IMAGE_KICK,
-            'snare': IMAGE_SNARE,
-            'hihat': IMAGE_HIHAT
-        }
-
-        try:
-            self.image = pygame.image.load(image_map[instrument])
-            self.image = pygame.transform.scale(self.image, (self.size, self.size))
-        except:
-            self.image = None
-            print(f"Could not load image for {instrument}")
+        # Shared image (loaded and scaled once per instrument)
+        self.image = FallingObject._get_image(instrument)
 
         # Visual effects
         self.alpha = 255
@@ -96,14 +199,14 @@ class FallingObject:
             self.y += self.falling_speed
 
             # Check if missed (passed target zone)
-            if self.y > self.target_y + 100 and not self.is_hit:
+            if self.y > self.miss_y and not self.is_hit:
                 self.is_missed = True
                 self.is_dead = True
 
             # Fade out if hit
             if self.is_hit:
-                self.alpha = max(0, self.alpha - 15)
-                self.scale += 0.05
+                self.alpha = max(0, self.alpha - self.FADE_ALPHA_STEP)
+                self.scale += self.FADE_SCALE_STEP
                 if self.alpha <= 0:
                     self.is_dead = True
 
@@ -117,39 +220,30 @@ class FallingObject:
         if not self.is_spawned or self.is_dead:
             return
 
-        if self.image:
-            # Apply visual effects (scale, alpha)
-            scaled_size = int(self.size * self.scale)
-            scaled_image = pygame.transform.scale(self.image, (scaled_size, scaled_size))
-
-            # Apply alpha
-            scaled_image.set_alpha(self.alpha)
+        if self.is_hit:
+            # Pick the pre-rendered fade frame (scale and alpha baked in)
+            fade_frames = FallingObject._get_fade_frames(self.instrument)
+            step = round((self.scale - 1.0) / self.FADE_SCALE_STEP)
+            scaled_image = fade_frames[min(step, len(fade_frames) - 1)]
+        else:
+            scaled_image = self.image
+        scaled_size = scaled_image.get_width()
 
-            # Center the scaled image - use visual_x for display
-            draw_x = self.visual_x + (self.size - scaled_size) // 2
-            draw_y = self.y + (self.size - scaled_size) // 2
+        # Center the scaled image - use visual_x for display
+        draw_x = self.visual_x + (self.size - scaled_size) // 2
+        draw_y = self.y + (self.size - scaled_size) // 2
 
-            screen.blit(scaled_image, (draw_x, draw_y))
-        else:
-            # Fallback: draw colored circle - use visual_x for display
-            color_map = {
-                'kick': (74, 144, 226),
-                'snare': (255, 107, 53),
-                'hihat': (255, 215, 0)
-            }
-            color = color_map.get(self.instrument, (255, 255, 255))
-
-            center_x = self.visual_x + self.size // 2
-            center_y = self.y + self.size // 2
-            pygame.draw.circle(screen, color, (center_x, center_y), self.size // 2)
+        screen.blit(scaled_image, (draw_x, draw_y))
 
     def get_rect(self) -> pygame.Rect:
         """Get bounding box for collision detection"""
         return pygame.Rect(self.x, self.y, self.size, self.size)
 
     def mark_hit(self):
-        """Mark object as hit"""
+        """Mark object as hit (removed at once when the fade-out is disabled)"""
         self.is_hit = True
+        if not GameSettings.ENABLE_GLOW:
+            self.is_dead = True
 
     def mark_missed(self):
         """Mark object as missed"""
@@ -179,27 +273,165 @@ class FallingObject:
         return distance <= window_distance
 
 
+class ManagedObject:
+    """
+    Lightweight view of one note stored in FallingObjectManager arrays
+    Exposes the FallingObject API used by collision and scoring
+    """
+
+    __slots__ = ('manager', 'index', 'instrument', 'x', 'size', 'target_y')
+
+    def __init__(self, manager: 'FallingObjectManager', index: int):
+        """
+        Initialize view
+
+        Args:
+            manager: Owning FallingObjectManager
+            index: Note index into the manager arrays
+        """
+        self.manager = manager
+        self.index = index
+        instrument_id = int(manager.instrument_ids[index])
+        self.instrument = INSTRUMENTS[instrument_id]
+        self.x = _TRACK_X[instrument_id]
+        self.size = OBJECT_SIZE
+        self.target_y = int(manager.target_ys[index])
+
+    @property
+    def y(self) -> float:
+        """Current Y position"""
+        return float(self.manager.ys[self.index])
+
+    @property
+    def is_spawned(self) -> bool:
+        """True once spawn time has passed"""
+        return bool(self.manager.state[self.index] & SPAWNED)
+
+    @property
+    def is_hit(self) -> bool:
+        """True if hit by the player"""
+        return bool(self.manager.state[self.index] & HIT)
+
+    @property
+    def is_missed(self) -> bool:
+        """True if passed the target without a hit"""
+        return bool(self.manager.state[self.index] & MISSED)
+
+    @property
+    def is_dead(self) -> bool:
+        """True if no longer rendered or updated"""
+        return bool(self.manager.state[self.index] & DEAD)
+
+    def get_rect(self) -> pygame.Rect:
+        """Get bounding box for collision detection"""
+        return pygame.Rect(self.x, self.y, self.size, self.size)
+
+    def mark_hit(self):
+        """Mark object as hit"""
+        self.manager.mark_hit(self.index)
+
+    def mark_missed(self):
+        """Mark object as missed"""
+        self.manager.state[self.index] |= MISSED | DEAD
+
+    def get_distance_from_target(self) -> float:
+        """
+        Get vertical distance from target zone (for timing accuracy)
+
+        Returns:
+            Distance in pixels (negative = before target, positive = after)
+        """
+        return self.y - self.target_y
+
+    def is_in_hit_window(self, window_distance: float) -> bool:
+        """
+        Check if object is within hit window
+
+        Args:
+            window_distance: Allowed distance in pixels
+
+        Returns:
+            True if within hit window
+        """
+        return abs(self.get_distance_from_target()) <= window_distance
+
+
 class FallingObjectManager:
-    """Manages all falling objects in the game"""
+    """
+    Manages all falling objects in the game
+    Notes are stored as parallel NumPy arrays (struct-of-arrays) sorted by
+    spawn time; motion, miss and fade updates are single vectorized ops over
+    the window of spawned, not-yet-dead notes
+    """
+
+    # Hit zone half-height in pixels
+    HIT_ZONE_RANGE = 150
 
-    def __init__(self, beatmap: list, falling_speed: float):
+    def __init__(self, beatmap: Beatmap, falling_speed: float):
         """
         Initialize falling object manager
 
         Args:
-            beatmap: List of (timestamp, instrument) tuples
+            beatmap: Beatmap (or list of (timestamp, instrument) tuples)
             falling_speed: Falling speed in pixels per frame
         """
+        if not isinstance(beatmap, Beatmap):
+            beatmap = Beatmap.from_pairs(beatmap)
+
         self.beatmap = beatmap
         self.falling_speed = falling_speed
-        self.objects = []
-
-        # Create all objects (they will spawn at their designated time)
-        for spawn_time, instrument in beatmap:
-            obj = FallingObject(instrument, spawn_time, falling_speed)
-            self.objects.append(obj)
 
-        print(f"Created {len(self.objects)} falling objects from beatmap")
+        # Per-lane constants for this speed, computed once and gathered per note
+        lane_target_ys = TARGET_Y_ARR.astype(np.float32)
+        lane_miss_ys = lane_target_ys + FallingObject.MISS_MARGIN
+        lane_visual_xs = SCREEN_WIDTH - TRACK_X_ARR - OBJECT_SIZE
+
+        # Spawn early so each note reaches its target at its beat time (60 FPS)
+        lane_fall_times = (TARGET_Y_ARR - OBJECT_SPAWN_Y) / (falling_speed * 60)
+        spawn_times = beatmap.times - lane_fall_times[beatmap.ids]
+
+        # Spawn time depends on the lane's target Y, so sort explicitly
+        order = np.argsort(spawn_times, kind='stable')
+        num_objects = len(order)
+
+        self.spawn_times = spawn_times[order]
+        self.instrument_ids = beatmap.ids[order]
+        self.target_ys = lane_target_ys[self.instrument_ids]
+        self.miss_ys = lane_miss_ys[self.instrument_ids]
+        self.visual_xs = lane_visual_xs[self.instrument_ids].tolist()
+        self.ys = np.full(num_objects, OBJECT_SPAWN_Y, dtype=np.float32)
+        self.state = np.zeros(num_objects, dtype=np.uint8)
+        self.fade_steps = np.zeros(num_objects, dtype=np.uint8)
+
+        # Notes that became missed during the last update() (for scoring)
+        self.new_misses = 0
+
+        # Without the hit fade-out, hit notes die immediately
+        self._hit_flags = HIT if GameSettings.ENABLE_GLOW else HIT | DEAD
+
+        # Live window [_lo, _hi): spawned notes, everything before _lo is dead
+        self._lo = 0
+        self._hi = 0
+
+        # Views are created on first use and reused
+        self._views = [None] * num_objects
+
+        # Sprites indexed by instrument ID as (surface, blit offset); the fade
+        # ladder grows each frame, so its offset keeps the note centred
+        self._sprites = [(FallingObject._get_image(name), 0) for name in INSTRUMENTS]
+        self._fade_sprites = [
+            [(frame, (OBJECT_SIZE - frame.get_width()) // 2) for frame in FallingObject._get_fade_frames(name)]
+            for name in INSTRUMENTS
+        ]
+
+        print(f"Created {num_objects} falling objects from beatmap")
+
+    def _view(self, index: int) -> ManagedObject:
+        """Get (cached) object view for a note index"""
+        view = self._views[index]
+        if view is None:
+            view = self._views[index] = ManagedObject(self, index)
+        return view
 
     def update(self, dt: float, current_time: float):
         """
@@ -209,31 +441,119 @@ class FallingObjectManager:
             dt: Delta time in seconds
             current_time: Current game time in seconds
         """
-        for obj in self.objects:
-            obj.update(dt, current_time)
+        # Spawn notes whose time has come
+        hi = int(np.searchsorted(self.spawn_times, current_time, side='right'))
+        self.state[self._hi:hi] |= SPAWNED
+        self._hi = hi
+
+        self.new_misses = 0
+        lo = self._lo
+        if lo == hi:
+            return
 
-        # Remove dead objects
-        self.objects = [obj for obj in self.objects if not obj.is_dead]
+        state = self.state[lo:hi]
+        ys = self.ys[lo:hi]
+        live = (state & DEAD) == 0
+        hit = (state & HIT) != 0
+
+        # Move downward
+        np.add(ys, self.falling_speed, out=ys, where=live)
+
+        # Missed: passed the target zone without being hit
+        missed = live & ~hit & (ys > self.miss_ys[lo:hi])
+        state[missed] |= MISSED | DEAD
+        self.new_misses = int(np.count_nonzero(missed))
+
+        # Fade out if hit, dead once fully transparent
+        fading = live & hit
+        fade_steps = self.fade_steps[lo:hi]
+        fade_steps[fading] += 1
+        faded = fading & (fade_steps.astype(np.int32) * FallingObject.FADE_ALPHA_STEP >= 255)
+        state[faded] |= DEAD
+
+        # Advance the window past the dead prefix - only needed when the
+        # oldest note died (misses die in order; faded hits wait their turn)
+        if state[0] & DEAD:
+            alive = np.flatnonzero((state & DEAD) == 0)
+            self._lo = lo + int(alive[0]) if len(alive) else hi
 
     def render(self, screen: pygame.Surface):
-        """Render all visible objects"""
-        for obj in self.objects:
-            obj.render(screen)
+        """Render all visible objects in a single batched blit"""
+        lo, hi = self._lo, self._hi
+        states = self.state[lo:hi].tolist()
+        ys = self.ys[lo:hi].tolist()
+        ids = self.instrument_ids[lo:hi].tolist()
+        fade_steps = self.fade_steps[lo:hi].tolist()
+        visual_xs = self.visual_xs
+        sprites = self._sprites
+        fade_sprites = self._fade_sprites
+
+        batch = []
+        for k, state in enumerate(states):
+            if state & DEAD:
+                continue
+
+            if state & HIT:
+                frames = fade_sprites[ids[k]]
+                image, offset = frames[min(fade_steps[k], len(frames) - 1)]
+            else:
+                image, offset = sprites[ids[k]]
+            batch.append((image, (visual_xs[lo + k] + offset, ys[k] + offset)))
+
+        screen.blits(batch, doreturn=False)
+
+    def _live_unhit_indices(self, mask=None) -> np.ndarray:
+        """
+        Indices of spawned notes that are neither dead nor hit
+
+        Args:
+            mask: Optional extra boolean mask over the live window
+
+        Returns:
+            Absolute note indices
+        """
+        lo, hi = self._lo, self._hi
+        selected = (self.state[lo:hi] & (DEAD | HIT)) == 0
+        if mask is not None:
+            selected &= mask
+        return np.flatnonzero(selected) + lo
 
     def get_active_objects(self) -> list:
         """Get all spawned, non-dead objects"""
-        return [obj for obj in self.objects if obj.is_spawned and not obj.is_dead and not obj.is_hit]
+        return [self._view(i) for i in self._live_unhit_indices().tolist()]
+
+    def _hit_zone_mask(self) -> np.ndarray:
+        """Boolean mask over the live window: notes within the hit zone"""
+        lo, hi = self._lo, self._hi
+        return np.abs(self.ys[lo:hi] - self.target_ys[lo:hi]) < self.HIT_ZONE_RANGE
 
     def get_objects_in_hit_zone(self) -> list:
         """Get objects currently in the hit zone"""
-        hit_zone_objects = []
-        for obj in self.get_active_objects():
-            # Within reasonable range of target
-            if abs(obj.get_distance_from_target()) < 150:
-                hit_zone_objects.append(obj)
-        return hit_zone_objects
+        return [self._view(i) for i in self._live_unhit_indices(self._hit_zone_mask()).tolist()]
+
+    def zone_view(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Hit-zone candidates as arrays for vectorized collision checks
+
+        Returns:
+            Tuple of (indices, distances, instrument_ids) for spawned,
+            non-hit, non-dead notes within the hit zone; distances are
+            absolute pixels from each note's target line
+        """
+        indices = self._live_unhit_indices(self._hit_zone_mask())
+        distances = np.abs(self.ys[indices] - self.target_ys[indices])
+        return indices, distances, self.instrument_ids[indices]
+
+    def mark_hit(self, indices: np.ndarray):
+        """
+        Mark notes as hit
+
+        Args:
+            indices: Note indices (as returned by zone_view)
+        """
+        self.state[indices] |= self._hit_flags
 
-    def get_object_by_instrument_in_zone(self, instrument: str) -> FallingObject:
+    def get_object_by_instrument_in_zone(self, instrument: str) -> ManagedObject:
         """
         Get the closest object of a specific instrument in hit zone
 
@@ -243,14 +563,16 @@ class FallingObjectManager:
         Returns:
             Closest matching object, or None
         """
-        matching_objects = [obj for obj in self.get_objects_in_hit_zone()
-                          if obj.instrument == instrument]
+        lo, hi = self._lo, self._hi
+        mask = self._hit_zone_mask() & (self.instrument_ids[lo:hi] == INSTRUMENT_ID[instrument])
+        indices = self._live_unhit_indices(mask)
 
-        if not matching_objects:
+        if not len(indices):
             return None
 
         # Return the one closest to target
-        return min(matching_objects, key=lambda obj: abs(obj.get_distance_from_target()))
+        distances = np.abs(self.ys[indices] - self.target_ys[indices])
+        return self._view(int(indices[np.argmin(distances)]))
 
     def count_total_objects(self) -> int:
         """Get total number of objects (for stats)"""
@@ -258,4 +580,4 @@ class FallingObjectManager:
 
     def count_remaining_objects(self) -> int:
         """Get number of objects still alive"""
-        return len(self.objects)
+        return int(np.count_nonzero((self.state & DEAD) == 0))
@@ -7,16 +7,22 @@ Manages game flow, state transitions, and component coordination
 import pygame
 import cv2
 import sys
+import time
 from enum import Enum
 
-from config.constants import SCREEN_WIDTH, SCREEN_HEIGHT, FPS, CAMERA_WIDTH, CAMERA_HEIGHT
+from config.constants import (
+    SCREEN_WIDTH, SCREEN_HEIGHT, FPS,
+    CAMERA_WIDTH, CAMERA_HEIGHT, CAMERA_FPS,
+    CAMERA_FALLBACK_WIDTH, CAMERA_FALLBACK_HEIGHT
+)
 from config.settings import GameSettings, DifficultySettings
 from config.beatmap import BeatmapGenerator, loop_beatmap
 
 from src.audio_manager import AudioManager
-from src.hand_tracker import HandTracker
+from src.camera_worker import CameraWorker, InferenceWorker, LATENCY_SMOOTHING
+from src.hand_tracker import HandTracker, FingertipZones
 from src.lane import LaneManager
-from src.falling_object import FallingObjectManager
+from src.falling_object import FallingObject, FallingObjectManager
 from src.collision import CollisionDetector
 from src.score_manager import ScoreManager
 
@@ -43,34 +49,61 @@ class GameManager:
 
     def __init__(self):
         """Initialize game manager and all subsystems"""
-        # Initialize Pygame
-        pygame.init()
-        pygame.mixer.init()
+        # Initialize Pygame (mixer is started lazily by AudioManager)
+        pygame.display.init()
+        pygame.font.init()
 
         # Create display
         self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
         pygame.display.set_caption("Hand Beats - Rhythm Game")
 
+        # Pre-convert note images to the display format before the first game
+        FallingObject.preload()
+
         # Clock for FPS control
+        # tick_busy_loop avoids coarse OS sleep granularity (e.g. ~15 ms on Windows)
         self.clock = pygame.time.Clock()
         self.fps = FPS
+        if GameSettings.BUSY_LOOP_TIMING:
+            self.tick = self.clock.tick_busy_loop
+        else:
+            self.tick = self.clock.tick
+
+        # Debug HUD: moving-average render + flip latency in milliseconds
+        self.render_ms = 0.0
+        self.debug_font = pygame.font.Font(None, 24)
+
+        # Static "WARM UP" banner, rendered once
+        warmup_font = pygame.font.Font(None, 72)
+        self.warmup_text = warmup_font.render("WARM UP", True, (255, 255, 0))
+        self.warmup_text_rect = self.warmup_text.get_rect(center=(SCREEN_WIDTH // 2, 100))
 
         # Game state
         self.state = GameState.MENU
         self.running = True
 
+        # Only QUIT and KEYDOWN are handled; block the rest in SDL so they
+        # never reach the Python event queue
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN])
+
         # Difficulty settings
         self.current_difficulty = None
+        self.use_chin = GameSettings.USE_CHIN
 
         # MULTIMEDIA COMPONENTS
 
         # AUDIO PROCESSING
-        self.audio_manager = AudioManager()
+        self.audio_manager = AudioManager(no_audio=not GameSettings.AUDIO_ENABLED)
         self.audio_manager.load_main_beat()
 
         # IMAGE/VIDEO PROCESSING
-        self.hand_tracker = HandTracker()
+        # Single tracker for the whole session so MediaPipe keeps tracking state
+        self.hand_tracker = HandTracker(model_complexity=0)
         self.camera = None
+        self.camera_worker = None
+        self.inference_worker = None
+        self.last_result_id = 0
 
         # Game components
         self.lane_manager = None
@@ -83,10 +116,20 @@ class GameManager:
         self.game_screen = GameScreen(self.screen)
         self.result_screen = ResultScreen(self.screen)
 
+        # Screens that consume input, by state
+        self._event_handlers = {
+            GameState.MENU: self.menu_screen.handle_events,
+            GameState.RESULT: self.result_screen.handle_events
+        }
+
         # Game timing
+        # The clock runs on integer milliseconds from clock.tick (no float drift
+        # over a full game); game_time is the derived value in seconds
+        self.game_time_ms = 0
         self.game_time = 0
         self.countdown_time = 3.0
         self.total_game_duration = GameSettings.GAME_DURATION
+        self.total_game_duration_ms = int(round(self.total_game_duration * 1000))
 
         # Beatmap
         self.beatmap = None
@@ -101,46 +144,93 @@ class GameManager:
     def run(self):
         """Main game loop"""
         while self.running:
-            dt = self.clock.tick(self.fps) / 1000.0  # Delta time in seconds
+            dt_ms = self.tick(self.fps)  # Delta time in integer milliseconds
 
             # Handle events
-            events = pygame.event.get()
+            events = pygame.event.get(eventtype=(pygame.QUIT, pygame.KEYDOWN))
             self.handle_events(events)
 
             # Update current state
-            self.update(dt)
+            self.update(dt_ms)
 
             # Render current state
+            render_start = time.perf_counter()
             self.render()
+            if GameSettings.DEBUG_MODE:
+                self.render_debug_hud()
 
             # Update display
             pygame.display.flip()
+            render_elapsed = (time.perf_counter() - render_start) * 1000.0
+            self.render_ms += LATENCY_SMOOTHING * (render_elapsed - self.render_ms)
 
         # Cleanup
         self.cleanup()
 
+    def render_debug_hud(self):
+        """Render FPS and per-stage latency (capture/inference/render) overlay"""
+        lines = []
+        if GameSettings.SHOW_FPS:
+            lines.append(f"FPS: {self.clock.get_fps():.0f}")
+        if self.camera_worker:
+            lines.append(f"Capture: {self.camera_worker.capture_ms:.1f} ms")
+        if self.inference_worker:
+            lines.append(f"Inference: {self.inference_worker.inference_ms:.1f} ms")
+        lines.append(f"Render: {self.render_ms:.1f} ms")
+
+        y = SCREEN_HEIGHT - 10 - 22 * len(lines)
+        for line in lines:
+            text = self.debug_font.render(line, True, (0, 255, 0))
+            self.screen.blit(text, (10, y))
+            y += 22
+
     def handle_events(self, events):
-        """Handle pygame events"""
+        """
+        Handle pygame events (only QUIT and KEYDOWN reach the queue)
+
+        Args:
+            events: List of pygame events
+        """
+        if not events:
+            return
+
+        # State-specific event handling
+        handler = self._event_handlers.get(self.state)
+        if handler:
+            handler(events)
+
+        # Global controls, single pass
         for event in events:
             if event.type == pygame.QUIT:
                 self.running = False
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE and self.state == GameState.PLAYING:
+                # Pause or return to menu
+                self.return_to_menu()
 
-        # State-specific event handling
-        if self.state == GameState.MENU:
-            self.menu_screen.handle_events(events)
+    def advance_game_clock(self, dt_ms: int):
+        """
+        Advance the game clock
 
-        elif self.state == GameState.RESULT:
-            self.result_screen.handle_events(events)
+        Args:
+            dt_ms: Elapsed time in milliseconds
+        """
+        self.game_time_ms += dt_ms
+        self.game_time = self.game_time_ms / 1000.0
 
-        # Global controls
-        for event in events:
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_ESCAPE and self.state == GameState.PLAYING:
-                    # Pause or return to menu
-                    self.return_to_menu()
+    def reset_game_clock(self):
+        """Restart the game clock at zero"""
+        self.game_time_ms = 0
+        self.game_time = 0
+
+    def update(self, dt_ms: int):
+        """
+        Update current game state
+
+        Args:
+            dt_ms: Frame time in milliseconds
+        """
+        dt = dt_ms / 1000.0  # Seconds for animations and countdown
 
-    def update(self, dt: float):
-        """Update current game state"""
         if self.state == GameState.MENU:
             self.menu_screen.update(dt)
 
@@ -150,16 +240,16 @@ class GameManager:
 
         elif self.state == GameState.WARMUP:
             # Update warmup objects
-            self.game_time += dt
+            self.advance_game_clock(dt_ms)
             for obj in self.warmup_objects:
                 obj.update(dt, self.game_time)
 
             # Check if all warmup objects have passed target zone
-            all_passed = all(obj.y > obj.target_y + 100 or obj.is_dead for obj in self.warmup_objects)
+            all_passed = all(obj.y > obj.miss_y or obj.is_dead for obj in self.warmup_objects)
             if all_passed and not self.warmup_completed:
                 self.warmup_completed = True
                 self.state = GameState.COUNTDOWN
-                self.game_time = 0
+                self.reset_game_clock()
                 self.countdown_time = 3.0
                 print("Warmup completed! Starting countdown...")
 
@@ -169,13 +259,16 @@ class GameManager:
             if self.countdown_time <= 0:
                 # Start actual game
                 self.state = GameState.PLAYING
-                self.game_time = 0
+                self.reset_game_clock()
+
+                # IMAGE PROCESSING: Detection is only needed while playing
+                self.inference_worker.set_enabled(True, self.use_chin)
 
                 # Start music
                 self.audio_manager.play_main_beat()
 
         elif self.state == GameState.PLAYING:
-            self.update_gameplay(dt)
+            self.update_gameplay(dt_ms)
 
         elif self.state == GameState.RESULT:
             # Check if should retry or return to menu
@@ -184,116 +277,104 @@ class GameManager:
             elif self.result_screen.should_return_to_menu():
                 self.return_to_menu()
 
-    def update_gameplay(self, dt: float):
+    def update_gameplay(self, dt_ms: int):
         """
         Update gameplay
         MULTIMEDIA PROCESSING: Integrate image, audio, video
+
+        Args:
+            dt_ms: Frame time in milliseconds
         """
-        self.game_time += dt
+        dt = dt_ms / 1000.0
+        self.advance_game_clock(dt_ms)
 
-        # Check if game over
-        if self.game_time >= self.total_game_duration:
+        # Check if game over (exact integer comparison)
+        if self.game_time_ms >= self.total_game_duration_ms:
             self.end_game()
             return
 
-        # VIDEO PROCESSING: Capture and process camera frame
-        ret, frame = self.camera.read()
-        if not ret:
+        # IMAGE PROCESSING: Take newest detection snapshot (non-blocking)
+        result_id, detections = self.inference_worker.get_latest()
+        if detections is None:
             return
 
-        # IMAGE PROCESSING: Detect hands and face using MediaPipe
-        frame, hand_results, face_results = self.hand_tracker.process_frame(frame)
-
-        # Get fingertip positions for COLLISION (inverted X)
-        fingertip_positions = self.hand_tracker.get_fingertip_positions(
-            hand_results,
-            SCREEN_WIDTH, SCREEN_HEIGHT
-        )
-
-        # Get fingertip positions for VISUAL (not inverted, matches video)
-        fingertip_visuals = self.hand_tracker.get_fingertip_visuals(
-            hand_results,
-            SCREEN_WIDTH, SCREEN_HEIGHT
-        )
-
-        # Get chin position for COLLISION (inverted X)
-        chin_position = self.hand_tracker.get_chin_position(
-            face_results,
-            SCREEN_WIDTH,
-            SCREEN_HEIGHT
-        )
+        # Only update tracking when inference delivered a new result
+        if result_id != self.last_result_id:
+            self.last_result_id = result_id
+            self.apply_detections(detections)
 
-        # Get chin position for VISUAL (not inverted)
-        chin_visual = self.hand_tracker.get_chin_visual(
-            face_results,
-            SCREEN_WIDTH,
-            SCREEN_HEIGHT
-        )
-
-        # Calculate velocities for gesture detection
-        fingertip_velocities = self.hand_tracker.calculate_velocity(
-            fingertip_positions,
-            self.hand_tracker.prev_fingertip_positions
-        )
-        chin_velocity = self.hand_tracker.calculate_chin_velocity(
-            chin_position,
-            self.hand_tracker.prev_chin_position
-        ) if chin_position else 0.0
-
-        # Update velocity tracking for next frame
-        self.hand_tracker.update_velocity_tracking(fingertip_positions, chin_position)
-
-        # Store frame and detection data for rendering
-        self.current_frame = frame
-        self.current_fingertips = fingertip_positions
-        self.current_fingertips_visual = fingertip_visuals
-        self.current_chin = chin_position
-        self.current_chin_visual = chin_visual
+        # Bind per-tick collaborators once (avoids repeated attribute lookups)
+        lane_manager = self.lane_manager
+        falling_objects = self.falling_objects
+        score_manager = self.score_manager
+        game_screen = self.game_screen
 
         # Update lanes with velocity check
-        active_lanes = self.lane_manager.check_collisions_with_velocity(
-            fingertip_positions,
-            chin_position,
-            fingertip_velocities,
-            chin_velocity,
-            self.hand_tracker.velocity_threshold
+        active_lanes = lane_manager.check_collisions_with_velocity(
+            self.current_fingertips,
+            self.current_chin,
+            self.current_fingertip_velocities,
+            self.current_chin_velocity,
+            self.hand_tracker.velocity_threshold,
+            self.use_chin
         )
 
         # Update lane visual state
-        self.lane_manager.update(dt)
+        lane_manager.update(dt)
 
         # Update falling objects
-        self.falling_objects.update(dt, self.game_time)
+        falling_objects.update(dt, self.game_time)
 
         # COLLISION DETECTION: Check for hits
-        objects_in_zone = self.falling_objects.get_objects_in_hit_zone()
-        hit_results = self.collision_detector.check_multiple_objects(objects_in_zone, active_lanes)
+        hit_results = self.collision_detector.check_zone(falling_objects, active_lanes)
 
         # Process hit results
-        for hit_result in hit_results:
-            # Update score
-            self.score_manager.add_hit(hit_result)
-
-            # Visual feedback
+        if hit_results:
+            add_hit = score_manager.add_hit
+            show_feedback = game_screen.show_feedback
+            play_hit_sound = self.audio_manager.play_hit_sound_by_rating
+            play_instrument = self.audio_manager.play_instrument_by_id
+            get_lane = lane_manager.get_lane_by_instrument
             feedback_text, feedback_color = self.collision_detector.get_timing_feedback(0)
-            self.game_screen.show_feedback(hit_result.rating, feedback_color)
 
-            # AUDIO PROCESSING: Play hit sound and instrument
-            self.audio_manager.play_hit_sound(hit_result.rating.lower())
-            self.audio_manager.play_instrument(hit_result.instrument)
+            for hit_result in hit_results:
+                # Update score
+                add_hit(hit_result)
 
-            # Visual feedback on lane
-            lane = self.lane_manager.get_lane_by_instrument(hit_result.instrument)
-            if lane:
-                lane.trigger_hit()
+                # Visual feedback
+                show_feedback(hit_result.rating, feedback_color)
 
-        # Check for missed objects
-        for obj in self.falling_objects.get_active_objects():
-            if obj.is_missed and not obj.is_dead:
-                self.score_manager.add_miss()
+                # AUDIO PROCESSING: Play hit sound and instrument
+                play_hit_sound(hit_result.rating_index)
+                play_instrument(hit_result.instrument_id)
+
+                # Visual feedback on lane
+                lane = get_lane(hit_result.instrument)
+                if lane:
+                    lane.trigger_hit()
+
+        # Count notes that passed their target during this update
+        score_manager.add_misses(falling_objects.new_misses)
 
         # Update game screen
-        self.game_screen.update(dt)
+        game_screen.update(dt)
+
+    def apply_detections(self, detections):
+        """
+        Store a detection snapshot for the following ticks
+        IMAGE PROCESSING: Coordinates and velocities were computed by the
+        inference thread
+
+        Args:
+            detections: Detections from the inference worker
+        """
+        self.current_frame = detections.frame
+        self.current_fingertips = detections.fingertips
+        self.current_fingertips_visual = detections.fingertips_visual
+        self.current_chin = detections.chin
+        self.current_chin_visual = detections.chin_visual
+        self.current_fingertip_velocities = detections.fingertip_velocities
+        self.current_chin_velocity = detections.chin_velocity
 
     def render(self):
         """Render current state"""
@@ -316,10 +397,7 @@ class GameManager:
             for obj in self.warmup_objects:
                 obj.render(self.screen)
             # Show "WARM UP" text
-            font = pygame.font.Font(None, 72)
-            text = font.render("WARM UP", True, (255, 255, 0))
-            text_rect = text.get_rect(center=(SCREEN_WIDTH // 2, 100))
-            self.screen.blit(text, text_rect)
+            self.screen.blit(self.warmup_text, self.warmup_text_rect)
 
         elif self.state == GameState.COUNTDOWN:
             # Show countdown
@@ -340,8 +418,8 @@ class GameManager:
             self.score_manager,
             self.game_time,
             self.total_game_duration,
-            self.current_fingertips_visual,  # Visual coords (not inverted)
-            self.current_chin_visual  # Visual coords (not inverted)
+            self.current_fingertips_visual,  # Visual coords (mirrored)
+            self.current_chin_visual  # Visual coords (mirrored)
         )
 
         # Render lanes
@@ -361,11 +439,7 @@ class GameManager:
         # Initialize camera
         if not self.camera:
             print("Initializing camera...")
-            self.camera = cv2.VideoCapture(0)
-            # === PERBAIKAN: Memaksa resolusi 16:9 ===
-            self.camera.set(cv2.CAP_PROP_FRAME_WIDTH, 1280)
-            self.camera.set(cv2.CAP_PROP_FRAME_HEIGHT, 720)
-            # =======================================
+            self.camera = self.open_camera()
             if not self.camera.isOpened():
                 print("Error: Cannot open camera")
                 self.running = False
@@ -375,6 +449,13 @@ class GameManager:
             actual_height = self.camera.get(cv2.CAP_PROP_FRAME_HEIGHT)
             print(f"Camera initialized: {int(actual_width)}x{int(actual_height)}")
 
+            # VIDEO/IMAGE PROCESSING: Capture and inference on background threads
+            self.camera_worker = CameraWorker(self.camera)
+            self.camera_worker.start()
+            self.inference_worker = InferenceWorker(self.camera_worker, self.hand_tracker)
+            self.inference_worker.start()
+            self.last_result_id = 0
+
         # Generate beatmap
         print("Generating beatmap...")
         generator = BeatmapGenerator(
@@ -385,7 +466,7 @@ class GameManager:
         )
 
         # Generate one loop and repeat it
-        one_loop = generator.generate()
+        one_loop = generator.generate_beatmap()
         num_loops = int(self.total_game_duration / GameSettings.BEAT_DURATION) + 1
         self.beatmap = loop_beatmap(one_loop, num_loops, GameSettings.BEAT_DURATION)
         print(f"Beatmap created: {len(self.beatmap)} notes")
@@ -402,22 +483,26 @@ class GameManager:
             ok_window=self.current_difficulty['ok_window']
         )
         self.score_manager = ScoreManager()
+        self.use_chin = self.current_difficulty.get('use_chin', GameSettings.USE_CHIN)
 
         # Reset state
-        self.game_time = 0
+        self.reset_game_clock()
+        self.total_game_duration_ms = int(round(self.total_game_duration * 1000))
         self.countdown_time = 3.0
         self.current_frame = None
-        self.current_fingertips = {}
+        self.current_fingertips = FingertipZones()
         self.current_fingertips_visual = {}
         self.current_chin = None
         self.current_chin_visual = None
+        self.current_fingertip_velocities = {}
+        self.current_chin_velocity = 0.0
 
         # Reset UI screens
         self.menu_screen.reset()
         self.result_screen.reset()
+        self.game_screen.reset()
 
         # Create warmup objects (3 objects: kick, hihat, snare)
-        from src.falling_object import FallingObject
         self.warmup_objects = []
         warmup_sequence = [
             (0.5, 'kick'),
@@ -440,10 +525,7 @@ class GameManager:
         print("\nGame Over!")
 
         # Release camera
-        if self.camera:
-            self.camera.release()
-            self.camera = None
-            print("Camera released")
+        self.release_camera()
 
         # Stop music
         self.audio_manager.stop_main_beat()
@@ -458,15 +540,77 @@ class GameManager:
         # Transition to result screen
         self.state = GameState.RESULT
 
+    def open_camera(self):
+        """
+        Open the webcam configured for low-latency capture
+        VIDEO PROCESSING: Platform backend that honors BUFFERSIZE, MJPG format,
+        one-frame driver queue
+
+        Returns:
+            cv2.VideoCapture instance (check isOpened())
+        """
+        # DirectShow / V4L2 honor CAP_PROP_BUFFERSIZE; fall back to auto-select
+        backend = {'win32': cv2.CAP_DSHOW, 'linux': cv2.CAP_V4L2}.get(sys.platform, cv2.CAP_ANY)
+        camera = cv2.VideoCapture(0, backend)
+        if not camera.isOpened() and backend != cv2.CAP_ANY:
+            camera = cv2.VideoCapture(0)
+
+        # MJPG cuts USB bandwidth so 720p can reach full frame rate
+        # (must be set before the resolution on most backends; a camera that
+        # rejects it keeps its default format)
+        camera.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*'MJPG'))
+
+        # === PERBAIKAN: Meminta resolusi 16:9 ===
+        # 16:9 is requested; cameras that cannot deliver it at full frame rate
+        # drop to the 4:3 fallback below
+        camera.set(cv2.CAP_PROP_FRAME_WIDTH, CAMERA_WIDTH)
+        camera.set(cv2.CAP_PROP_FRAME_HEIGHT, CAMERA_HEIGHT)
+        camera.set(cv2.CAP_PROP_FPS, CAMERA_FPS)
+        # =======================================
+
+        # Fall back only on what the camera reports (FOURCC read-back is
+        # unreliable across backends; 0 means the value is unknown).
+        # FPS is rounded so NTSC rates (29.97) count as the requested 30
+        width = camera.get(cv2.CAP_PROP_FRAME_WIDTH)
+        height = camera.get(cv2.CAP_PROP_FRAME_HEIGHT)
+        fps = camera.get(cv2.CAP_PROP_FPS)
+        if 0 < width < CAMERA_WIDTH or 0 < height < CAMERA_HEIGHT or 0 < round(fps) < CAMERA_FPS:
+            print(f"[WARNING] Camera reports {int(width)}x{int(height)} @ {fps:.2f} FPS, "
+                  f"using {CAMERA_FALLBACK_WIDTH}x{CAMERA_FALLBACK_HEIGHT}")
+            camera.set(cv2.CAP_PROP_FRAME_WIDTH, CAMERA_FALLBACK_WIDTH)
+            camera.set(cv2.CAP_PROP_FRAME_HEIGHT, CAMERA_FALLBACK_HEIGHT)
+            camera.set(cv2.CAP_PROP_FPS, CAMERA_FPS)
+
+        # Keep driver queue short so the newest frame is always delivered
+        if not camera.set(cv2.CAP_PROP_BUFFERSIZE, 1):
+            print("[WARNING] Camera backend ignores CAP_PROP_BUFFERSIZE, frames may lag")
+
+        return camera
+
+    def release_camera(self):
+        """Stop capture/inference threads and release camera"""
+        if self.inference_worker:
+            self.inference_worker.stop()
+            self.inference_worker = None
+
+        # The capture thread owns the camera and releases it on exit
+        if self.camera_worker:
+            if not self.camera_worker.stop():
+                print("[WARNING] Camera capture is stalled, it is released once grab() returns")
+            self.camera_worker = None
+        elif self.camera:
+            self.camera.release()
+
+        if self.camera:
+            self.camera = None
+            print("Camera released")
+
     def return_to_menu(self):
         """Return to main menu"""
         print("[INFO] Returning to menu...")
 
         # Release camera
-        if self.camera:
-            self.camera.release()
-            self.camera = None
-            print("Camera released")
+        self.release_camera()
 
         # Stop music
         self.audio_manager.stop_main_beat()
@@ -480,9 +624,8 @@ class GameManager:
         print("\n[CLEANUP] Cleaning up...")
 
         # Release camera
-        if self.camera:
-            self.camera.release()
-            self.camera = None
+        self.release_camera()
+        self.game_screen.cleanup()
 
         # Cleanup audio
         self.audio_manager.cleanup()
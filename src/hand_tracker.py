@@ -5,47 +5,151 @@ Processes video frames to extract hand and chin positions
 """
 
 import cv2
+import os
+import time
 import mediapipe as mp
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
 from typing import Dict, Optional
 from config.constants import (
     HAND_DETECTION_CONFIDENCE,
     HAND_TRACKING_CONFIDENCE,
     MAX_HANDS,
-    TOPBAR_HEIGHT
+    TOPBAR_HEIGHT,
+    INFERENCE_WIDTH,
+    INFERENCE_HEIGHT,
+    MODEL_HAND_LANDMARKER,
+    MODEL_HAND_LANDMARKER_INT8,
+    MODEL_FACE_LANDMARKER
 )
 from config.settings import GameSettings
 
+# MediaPipe labels handedness assuming a mirrored (selfie) image; frames are
+# processed unmirrored, so swap the labels to keep them the player's real hands
+_MIRROR_LABEL = {'Left': 'Right', 'Right': 'Left'}
+
+# Rows of the velocity tracking arrays
+_TRACK_SLOTS = {'Left': 0, 'Right': 1}
+_CHIN_SLOT = 2
+_TRACK_POINTS = 3
+
+# Fingertip collision zone size in pixels
+ZONE_SIZE = 40
+
+# Shared "nothing detected" results returned for blank frames
+_NO_HANDS = SimpleNamespace(multi_hand_landmarks=None, multi_handedness=None)
+_NO_FACE = SimpleNamespace(multi_face_landmarks=None)
+
+
+def _legacy_hand_results(result):
+    """
+    View a Tasks HandLandmarkerResult in the legacy Solutions layout
+    (multi_hand_landmarks[i].landmark, multi_handedness[i].classification[0].label)
+    """
+    if not result.hand_landmarks:
+        return SimpleNamespace(multi_hand_landmarks=None, multi_handedness=None)
+    return SimpleNamespace(
+        multi_hand_landmarks=[SimpleNamespace(landmark=landmarks) for landmarks in result.hand_landmarks],
+        multi_handedness=[
+            SimpleNamespace(classification=[SimpleNamespace(label=categories[0].category_name)])
+            for categories in result.handedness
+        ]
+    )
+
+
+def _legacy_face_results(result):
+    """View a Tasks FaceLandmarkerResult in the legacy Solutions layout"""
+    return SimpleNamespace(
+        multi_face_landmarks=[SimpleNamespace(landmark=landmarks) for landmarks in result.face_landmarks] or None
+    )
+
+
+class FingertipZones:
+    """
+    Fingertip collision zones of one detection, one row per hand
+    COLLISION DETECTION: (H, 6) int32 array with columns
+    x, y, width, height, center_x, center_y; labels in the same row order
+    """
+
+    __slots__ = ('labels', 'data')
+
+    def __init__(self, labels=(), data=None):
+        """
+        Initialize fingertip zones
+
+        Args:
+            labels: Hand label per row ('Left' / 'Right')
+            data: (H, 6) int32 zone array, empty when omitted
+        """
+        self.labels = labels
+        self.data = data if data is not None else np.empty((0, 6), dtype=np.int32)
+
+    def __len__(self) -> int:
+        return len(self.labels)
+
+    def as_dict(self) -> Dict[str, Dict]:
+        """
+        Per-hand zone dicts, for callers that want named fields
+
+        Returns:
+            Dictionary of hand label -> {'x', 'y', 'width', 'height', 'center_x', 'center_y'}
+        """
+        keys = ('x', 'y', 'width', 'height', 'center_x', 'center_y')
+        return {
+            label: dict(zip(keys, row)) for label, row in zip(self.labels, self.data.tolist())
+        }
+
 
 class HandTracker:
     """
     Hand and face detection and tracking using MediaPipe
     IMAGE PROCESSING: Real-time landmark detection from video frames
+
+    Create ONE instance for the whole game lifetime: in video mode MediaPipe
+    derives the hand location from the previous frame's landmarks and only
+    reruns the (expensive) palm detector when tracking is lost.
     """
 
-    def __init__(self):
-        """Initialize MediaPipe Hands and Face Mesh"""
+    def __init__(self, model_complexity: int = 0,
+                 min_tracking_confidence: float = HAND_TRACKING_CONFIDENCE):
+        """
+        Initialize MediaPipe Hands and Face Mesh
+
+        Args:
+            model_complexity: Hand landmark model, 0 = lite (fastest), 1 = full
+            min_tracking_confidence: Below this, palm detection reruns next frame
+        """
         self.mp_hands = mp.solutions.hands
         self.mp_face_mesh = mp.solutions.face_mesh
         self.mp_draw = mp.solutions.drawing_utils
 
-        # Initialize hands detector - OPTIMIZED for low latency
-        self.hands = self.mp_hands.Hands(
-            static_image_mode=False,
-            max_num_hands=MAX_HANDS,
-            model_complexity=0,
-            min_detection_confidence=0.5,
-            min_tracking_confidence=0.5
-        )
-
-        # Initialize face mesh - OPTIMIZED for low latency
-        self.face_mesh = self.mp_face_mesh.FaceMesh(
-            static_image_mode=False,
-            max_num_faces=1,
-            refine_landmarks=False,
-            min_detection_confidence=0.5,
-            min_tracking_confidence=0.5
+        # Tasks API (GPU delegate or int8 models) when enabled and available
+        self.use_tasks = (
+            (GameSettings.MEDIAPIPE_GPU or GameSettings.USE_INT8_MODELS)
+            and self._create_task_landmarkers(min_tracking_confidence)
         )
+        self._timestamp_ms = 0
+
+        if not self.use_tasks:
+            # Initialize hands detector - OPTIMIZED for low latency
+            # static_image_mode=False enables landmark tracking between frames
+            self.hands = self.mp_hands.Hands(
+                static_image_mode=False,
+                max_num_hands=MAX_HANDS,
+                model_complexity=model_complexity,
+                min_detection_confidence=0.5,
+                min_tracking_confidence=min_tracking_confidence
+            )
+
+            # Initialize face mesh - OPTIMIZED for low latency
+            self.face_mesh = self.mp_face_mesh.FaceMesh(
+                static_image_mode=False,
+                max_num_faces=1,
+                refine_landmarks=False,
+                min_detection_confidence=0.5,
+                min_tracking_confidence=0.5
+            )
 
         # Drawing styles
         self.landmark_style = self.mp_draw.DrawingSpec(
@@ -55,76 +159,278 @@ class HandTracker:
             color=(255, 255, 255), thickness=2
         )
 
+        # Index-tip coordinates of the last hand result (see _hand_tips)
+        self._tips_source = None
+        self._tips = None
+        self._tip_labels = None
+
+        # Chin landmark of the last face result (see _chin_point)
+        self._chin_source = None
+        self._chin = None
+
+        # Helper thread running face mesh concurrently with hands
+        self._face_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix='face_mesh')
+
+        # Face mesh throttling: the last face result is reused in between runs
+        self.face_interval = max(1, GameSettings.FACE_MESH_INTERVAL)
+        self._face_skip = 0
+        self._face_results_last = None
+        self.face_reused = False
+
+        # Reusable scratch buffers, allocated on first frame (size is camera-dependent)
+        # Only frames that stay inside process_frame use them: the returned camera
+        # frame is handed to the game thread and must be a fresh array
+        self._frame_shape = None
+        self._small_buffer = None
+        self._rgb_buffer = None
+
         # Velocity tracking for gesture detection
-        self.prev_fingertip_positions = {}
-        self.prev_chin_position = None
+        # One row per tracked point (Left, Right, chin), current and previous frame
+        self._track_curr = np.zeros((_TRACK_POINTS, 2), dtype=np.float32)
+        self._track_prev = np.zeros_like(self._track_curr)
+        self._track_delta = np.zeros_like(self._track_curr)
+        self._track_speed = np.zeros(_TRACK_POINTS, dtype=np.float32)
+        self._track_seen = np.zeros(_TRACK_POINTS, dtype=bool)
+        self._prev_seen = np.zeros_like(self._track_seen)
         self.velocity_threshold = 15.0  # Minimum speed (pixels per frame) for valid hit
 
-    def process_frame(self, frame: np.ndarray) -> tuple:
+        # Chin speed held while face mesh is skipped, and frames since it last ran
+        self._chin_speed = 0.0
+        self._chin_frames = 0
+
+    def _create_task_landmarkers(self, min_tracking_confidence: float) -> bool:
+        """
+        Create Tasks API hand/face landmarkers
+        GPU delegate with MEDIAPIPE_GPU, otherwise CPU with the int8 hand model
+        (int8 kernels are a CPU/XNNPACK path; the FP32 model is used if it is missing)
+        VIDEO mode (synchronous, tracking between frames): the inference
+        worker already runs detection off the game thread
+
+        Args:
+            min_tracking_confidence: Below this, palm detection reruns next frame
+
+        Returns:
+            True on success, False to fall back to the Solutions graphs
+        """
+        try:
+            from mediapipe.tasks.python import BaseOptions
+            from mediapipe.tasks.python.vision import (
+                FaceLandmarker, FaceLandmarkerOptions,
+                HandLandmarker, HandLandmarkerOptions, RunningMode
+            )
+
+            use_gpu = GameSettings.MEDIAPIPE_GPU
+            delegate = BaseOptions.Delegate.GPU if use_gpu else BaseOptions.Delegate.CPU
+            hand_model = MODEL_HAND_LANDMARKER
+            if not use_gpu:
+                if os.path.exists(MODEL_HAND_LANDMARKER_INT8):
+                    hand_model = MODEL_HAND_LANDMARKER_INT8
+                else:
+                    print(f"[WARNING] {MODEL_HAND_LANDMARKER_INT8} not found, using FP32 hand model")
+
+            hands = HandLandmarker.create_from_options(HandLandmarkerOptions(
+                base_options=BaseOptions(model_asset_path=hand_model, delegate=delegate),
+                running_mode=RunningMode.VIDEO,
+                num_hands=MAX_HANDS,
+                min_hand_detection_confidence=0.5,
+                min_tracking_confidence=min_tracking_confidence
+            ))
+            try:
+                face = FaceLandmarker.create_from_options(FaceLandmarkerOptions(
+                    base_options=BaseOptions(model_asset_path=MODEL_FACE_LANDMARKER, delegate=delegate),
+                    running_mode=RunningMode.VIDEO,
+                    num_faces=1,
+                    min_face_detection_confidence=0.5,
+                    min_tracking_confidence=0.5
+                ))
+            except Exception:
+                hands.close()
+                raise
+        except Exception as e:
+            print(f"[WARNING] MediaPipe Tasks landmarkers unavailable, using Solutions: {e}")
+            return False
+
+        self.hands = hands
+        self.face_mesh = face
+        print(f"[OK] MediaPipe landmarkers on {'GPU' if use_gpu else 'CPU'} delegate ({hand_model})")
+        return True
+
+    def _detect_hands(self, image):
+        """Run the hand graph on one prepared input (see process_frame)"""
+        if self.use_tasks:
+            return _legacy_hand_results(self.hands.detect_for_video(image, self._timestamp_ms))
+        return self.hands.process(image)
+
+    def _detect_face(self, image):
+        """Run the face graph on one prepared input (see process_frame)"""
+        if self.use_tasks:
+            return _legacy_face_results(self.face_mesh.detect_for_video(image, self._timestamp_ms))
+        return self.face_mesh.process(image)
+
+    def process_frame(self, frame: np.ndarray, need_face: bool = True) -> tuple:
         """
         Process video frame to detect hands and face.
-        Flips the frame horizontally for intuitive mirror-like control.
+        The frame is NOT flipped here: landmark X is mirrored during coordinate
+        mapping and the display mirrors the image while scaling it to the screen.
 
         Args:
             frame: BGR image from camera
+            need_face: Run face mesh (skip when the chin is not used); even then
+                it only runs every face_interval frames, the last result is
+                returned in between (face_reused is set)
 
         Returns:
-            Tuple of (flipped_frame, hand_results, face_results)
+            Tuple of (bgr_frame, hand_results, face_results)
+            The camera frame is returned untouched for display (pygame reads BGR),
+            only the inference-size copy is converted to RGB
         """
-        # === PERBAIKAN A: FLIP VISUAL (MIRROR) ===
-        frame = cv2.flip(frame, 1)
-        # ========================================
-        
-        # Convert BGR to RGB (required by MediaPipe)
-        rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+        # Black frame (camera warm-up, covered lens): nothing to detect,
+        # sampled on a sparse grid so the check costs next to nothing
+        if frame[::32, ::32].mean() < GameSettings.DARK_FRAME_LEVEL:
+            self.face_reused = False
+            return frame, _NO_HANDS, _NO_FACE if need_face else None
+
+        if frame.shape != self._frame_shape:
+            self._frame_shape = frame.shape
+
+            # Inference size: fit the camera frame inside the inference box,
+            # keeping its aspect ratio (e.g. 1280x720 -> 640x360, 640x480 -> 480x360)
+            src_h, src_w = frame.shape[:2]
+            scale = min(INFERENCE_WIDTH / src_w, INFERENCE_HEIGHT / src_h)
+            if scale < 1.0:
+                small_shape = (round(src_h * scale), round(src_w * scale), 3)
+                self._small_buffer = np.empty(small_shape, dtype=np.uint8)
+            else:
+                self._small_buffer = None  # Already small enough
+                small_shape = frame.shape
+            self._rgb_buffer = np.empty(small_shape, dtype=np.uint8)
+
+        # Downscale for inference - full-res frame is kept for display only
+        if self._small_buffer is not None:
+            small_frame = cv2.resize(
+                frame,
+                (self._small_buffer.shape[1], self._small_buffer.shape[0]),
+                dst=self._small_buffer,
+                interpolation=cv2.INTER_AREA
+            )
+        else:
+            small_frame = frame
+
+        # Convert BGR to RGB (required by MediaPipe) at inference size only
+        self._rgb_buffer.flags.writeable = True
+        rgb_small = cv2.cvtColor(small_frame, cv2.COLOR_BGR2RGB, dst=self._rgb_buffer)
+
+        # Read-only input lets MediaPipe wrap the buffer instead of copying it
+        rgb_small.flags.writeable = False
+
+        # Tasks API: one mp.Image per frame, timestamps must strictly increase
+        if self.use_tasks:
+            rgb_small = mp.Image(image_format=mp.ImageFormat.SRGB, data=rgb_small)
+            self._timestamp_ms = max(self._timestamp_ms + 1, int(time.perf_counter() * 1000))
+
+        # Face mesh is the heaviest graph and the chin moves slowly:
+        # only run it every face_interval frames
+        run_face = need_face and self._face_skip == 0
+        if need_face:
+            self._face_skip = (self._face_skip + 1) % self.face_interval
+        else:
+            self._face_skip = 0
+            self._face_results_last = None
+        self.face_reused = need_face and not run_face
 
         # Process frame through MediaPipe for hands and face
-        hand_results = self.hands.process(rgb_frame)
-        face_results = self.face_mesh.process(rgb_frame)
+        # The graphs are independent and release the GIL, so face mesh runs on
+        # a helper thread while hands runs here: latency is max(), not sum
+        if run_face:
+            face_future = self._face_pool.submit(self._detect_face, rgb_small)
+            hand_results = self._detect_hands(rgb_small)
+            face_results = face_future.result()
+            self._face_results_last = face_results
+        else:
+            hand_results = self._detect_hands(rgb_small)
+            face_results = self._face_results_last
 
         return frame, hand_results, face_results
 
-    def get_fingertip_positions(self, results, screen_width: int, screen_height: int) -> Dict[str, Dict]:
+    def _project_tips(self, results, screen_width: int, screen_height: int, mirror_x: bool) -> tuple:
         """
-        Get index fingertip positions for COLLISION detection (inverted X).
+        Project every index fingertip to screen pixels in one vectorized pass
 
         Args:
-            results: MediaPipe hand results
+            results: MediaPipe hand results (with at least one hand)
             screen_width: Game screen width
             screen_height: Game screen height
+            mirror_x: Mirror X (visual) instead of raw camera X (collision)
 
         Returns:
-            Dictionary with fingertip positions (X inverted for collision)
+            Tuple of (labels, int32 x array, int32 y array)
         """
-        fingertip_zones = {}
+        labels, tips = self._hand_tips(results)
 
-        if not results.multi_hand_landmarks:
-            return fingertip_zones
+        tip_xs = 1.0 - tips[:, 0] if mirror_x else tips[:, 0]
+        xs = (tip_xs * screen_width).astype(np.int32)
 
-        for idx, hand_landmarks in enumerate(results.multi_hand_landmarks):
-            hand_label = results.multi_handedness[idx].classification[0].label
-            index_tip = hand_landmarks.landmark[8]
+        # Y offset by top bar
+        ys = (tips[:, 1] * (screen_height - TOPBAR_HEIGHT) + TOPBAR_HEIGHT).astype(np.int32)
 
-            # Invert X for collision detection (matches zone positions)
-            tip_x_collision = int((1 - index_tip.x) * screen_width)
+        return labels, xs, ys
 
-            # Y offset by top bar
-            tip_y = int(index_tip.y * (screen_height - TOPBAR_HEIGHT) + TOPBAR_HEIGHT)
+    def _hand_tips(self, results) -> tuple:
+        """
+        Read hand labels and normalized index-tip coordinates once per result
+        The collision and visual projections share one protobuf walk
 
-            zone_size = 40
-            fingertip_zones[hand_label] = {
-                'x': tip_x_collision - zone_size // 2,
-                'y': tip_y - zone_size // 2,
-                'width': zone_size,
-                'height': zone_size,
-                'center_x': tip_x_collision,
-                'center_y': tip_y
-            }
-        return fingertip_zones
+        Args:
+            results: MediaPipe hand results (with at least one hand)
+
+        Returns:
+            Tuple of (labels, (N, 2) float64 array of normalized x, y)
+        """
+        if results is not self._tips_source:
+            hands = results.multi_hand_landmarks
+            self._tips = np.fromiter(
+                (coord for hand_landmarks in hands
+                 for coord in (hand_landmarks.landmark[8].x, hand_landmarks.landmark[8].y)),
+                dtype=np.float64,
+                count=2 * len(hands)
+            ).reshape(-1, 2)
+            self._tip_labels = [
+                _MIRROR_LABEL[handedness.classification[0].label] for handedness in results.multi_handedness
+            ]
+            self._tips_source = results
+
+        return self._tip_labels, self._tips
+
+    def get_fingertip_positions(self, results, screen_width: int, screen_height: int) -> FingertipZones:
+        """
+        Get index fingertip positions for COLLISION detection (camera X).
+
+        Args:
+            results: MediaPipe hand results
+            screen_width: Game screen width
+            screen_height: Game screen height
+
+        Returns:
+            FingertipZones with one row per hand (unmirrored X for collision)
+        """
+        if not results.multi_hand_landmarks:
+            return FingertipZones()
+
+        # Unmirrored frame: raw X is already the collision X (matches zone positions)
+        labels, xs, ys = self._project_tips(results, screen_width, screen_height, False)
+        half = ZONE_SIZE // 2
+
+        data = np.empty((len(labels), 6), dtype=np.int32)
+        np.subtract(xs, half, out=data[:, 0])
+        np.subtract(ys, half, out=data[:, 1])
+        data[:, 2:4] = ZONE_SIZE
+        data[:, 4] = xs
+        data[:, 5] = ys
+        return FingertipZones(labels, data)
 
     def get_fingertip_visuals(self, results, screen_width: int, screen_height: int) -> Dict[str, Dict]:
         """
-        Get fingertip positions for VISUAL display (NOT inverted, matches flipped video).
+        Get fingertip positions for VISUAL display (mirrored X, matches mirrored video).
 
         Args:
             results: MediaPipe hand results
@@ -132,153 +438,165 @@ class HandTracker:
             screen_height: Game screen height
 
         Returns:
-            Dictionary with fingertip visual positions (no X inversion)
+            Dictionary with fingertip visual positions (mirrored X)
         """
         fingertip_visuals = {}
 
         if not results.multi_hand_landmarks:
             return fingertip_visuals
 
-        for idx, hand_landmarks in enumerate(results.multi_hand_landmarks):
-            hand_label = results.multi_handedness[idx].classification[0].label
-            index_tip = hand_landmarks.landmark[8]
-
-            # NO X inversion - use raw coordinates (matches flipped video)
-            tip_x_visual = int(index_tip.x * screen_width)
-            tip_y = int(index_tip.y * (screen_height - TOPBAR_HEIGHT) + TOPBAR_HEIGHT)
-
+        # Mirror X to match the mirrored video
+        labels, xs, ys = self._project_tips(results, screen_width, screen_height, True)
+        for hand_label, tip_x, tip_y in zip(labels, xs.tolist(), ys.tolist()):
             fingertip_visuals[hand_label] = {
-                'center_x': tip_x_visual,
+                'center_x': tip_x,
                 'center_y': tip_y
             }
         return fingertip_visuals
 
+    def _chin_point(self, face_results) -> tuple:
+        """
+        Read the normalized chin landmark once per face result
+        Collision and visual positions share one protobuf lookup, and a face
+        result reused between face mesh runs is not read again
+
+        Args:
+            face_results: MediaPipe FaceMesh results (with a face)
+
+        Returns:
+            Tuple of normalized (x, y)
+        """
+        if face_results is not self._chin_source:
+            chin_landmark = face_results.multi_face_landmarks[0].landmark[152]
+            self._chin = (chin_landmark.x, chin_landmark.y)
+            self._chin_source = face_results
+
+        return self._chin
+
     def get_chin_position(self, face_results, screen_width: int, screen_height: int) -> Optional[Dict]:
         """
-        Get chin position for COLLISION detection (inverted X).
+        Get chin position for COLLISION detection (camera X).
 
         Args:
-            face_results: MediaPipe FaceMesh results
+            face_results: MediaPipe FaceMesh results (None if face mesh was skipped)
             screen_width: Game screen width
             screen_height: Game screen height
 
         Returns:
-            Dictionary with chin position (X inverted for collision), or None
+            Dictionary with chin position (unmirrored X for collision), or None
         """
-        if not face_results.multi_face_landmarks:
+        if face_results is None or not face_results.multi_face_landmarks:
             return None
 
-        face_landmarks = face_results.multi_face_landmarks[0]
-        chin_landmark = face_landmarks.landmark[152]
+        chin_x, chin_y = self._chin_point(face_results)
 
-        # Invert X for collision detection
-        chin_x_collision = int((1 - chin_landmark.x) * screen_width)
-        chin_y = int(chin_landmark.y * (screen_height - TOPBAR_HEIGHT) + TOPBAR_HEIGHT)
+        # Unmirrored frame: raw X is already the collision X
+        chin_x_collision = int(chin_x * screen_width)
+        chin_y = int(chin_y * (screen_height - TOPBAR_HEIGHT) + TOPBAR_HEIGHT)
 
-        zone_size = 40
         return {
-            'x': chin_x_collision - zone_size // 2,
-            'y': chin_y - zone_size // 2,
-            'width': zone_size,
-            'height': zone_size,
+            'x': chin_x_collision - ZONE_SIZE // 2,
+            'y': chin_y - ZONE_SIZE // 2,
+            'width': ZONE_SIZE,
+            'height': ZONE_SIZE,
             'center_x': chin_x_collision,
             'center_y': chin_y
         }
 
     def get_chin_visual(self, face_results, screen_width: int, screen_height: int) -> Optional[Dict]:
         """
-        Get chin position for VISUAL display (NOT inverted, matches flipped video).
+        Get chin position for VISUAL display (mirrored X, matches mirrored video).
 
         Args:
-            face_results: MediaPipe FaceMesh results
+            face_results: MediaPipe FaceMesh results (None if face mesh was skipped)
             screen_width: Game screen width
             screen_height: Game screen height
 
         Returns:
-            Dictionary with chin visual position (no X inversion), or None
+            Dictionary with chin visual position (mirrored X), or None
         """
-        if not face_results.multi_face_landmarks:
+        if face_results is None or not face_results.multi_face_landmarks:
             return None
 
-        face_landmarks = face_results.multi_face_landmarks[0]
-        chin_landmark = face_landmarks.landmark[152]
+        chin_x, chin_y = self._chin_point(face_results)
 
-        # NO X inversion - matches flipped video
-        chin_x_visual = int(chin_landmark.x * screen_width)
-        chin_y = int(chin_landmark.y * (screen_height - TOPBAR_HEIGHT) + TOPBAR_HEIGHT)
+        # Mirror X to match the mirrored video
+        chin_x_visual = int((1 - chin_x) * screen_width)
+        chin_y = int(chin_y * (screen_height - TOPBAR_HEIGHT) + TOPBAR_HEIGHT)
 
         return {
             'center_x': chin_x_visual,
             'center_y': chin_y
         }
 
-    def calculate_velocity(self, current_positions: Dict, previous_positions: Dict) -> Dict[str, float]:
-        """
-        Calculate velocity (speed) of hand movement for gesture detection.
-
-        Args:
-            current_positions: Current frame positions
-            previous_positions: Previous frame positions
-
-        Returns:
-            Dictionary with hand labels and their velocities
-        """
-        velocities = {}
-
-        for hand_label in current_positions:
-            if hand_label in previous_positions:
-                curr = current_positions[hand_label]
-                prev = previous_positions[hand_label]
-
-                # Calculate Euclidean distance
-                dx = curr['center_x'] - prev['center_x']
-                dy = curr['center_y'] - prev['center_y']
-                velocity = (dx**2 + dy**2) ** 0.5
-
-                velocities[hand_label] = velocity
-            else:
-                # First detection, assume zero velocity
-                velocities[hand_label] = 0.0
-
-        return velocities
-
-    def calculate_chin_velocity(self, current_position: Dict, previous_position: Optional[Dict]) -> float:
+    def calculate_velocities(self, fingertip_positions: FingertipZones, chin_position: Optional[Dict],
+                             frames_elapsed: int = 1) -> tuple:
         """
-        Calculate velocity of chin movement for gesture detection.
+        Calculate velocity (speed) of fingertips and chin for gesture detection.
+        All tracked points are stacked in one array and measured in a single pass.
 
         Args:
-            current_position: Current chin position
-            previous_position: Previous chin position
+            fingertip_positions: Current fingertip zones
+            chin_position: Current chin zone, or None
+            frames_elapsed: Camera frames since the previous detection
 
         Returns:
-            Velocity (speed) of chin movement
+            Tuple of (dict of hand label -> velocity, chin velocity)
         """
-        if previous_position is None:
-            return 0.0
-
-        dx = current_position['center_x'] - previous_position['center_x']
-        dy = current_position['center_y'] - previous_position['center_y']
-        velocity = (dx**2 + dy**2) ** 0.5
-
-        return velocity
+        curr = self._track_curr
+        seen = self._track_seen
+        seen.fill(False)
+
+        labels = fingertip_positions.labels
+        if labels:
+            slots = [_TRACK_SLOTS[hand_label] for hand_label in labels]
+            curr[slots] = fingertip_positions.data[:, 4:6]
+            seen[slots] = True
+
+        if chin_position:
+            curr[_CHIN_SLOT, 0] = chin_position['center_x']
+            curr[_CHIN_SLOT, 1] = chin_position['center_y']
+            seen[_CHIN_SLOT] = True
+
+        # Euclidean distance per point; first detection counts as zero velocity
+        delta = np.subtract(curr, self._track_prev, out=self._track_delta)
+        speed = np.hypot(delta[:, 0], delta[:, 1], out=self._track_speed)
+        speed *= seen & self._prev_seen
+
+        # Chin reused from an earlier face mesh run: hold its last speed; the
+        # next real measurement spans every frame since the previous one
+        chin_frames = self._chin_frames + frames_elapsed
+        if self.face_reused:
+            self._chin_frames = chin_frames
+            chin_speed = self._chin_speed
+        else:
+            self._chin_frames = 0
+            chin_speed = self._chin_speed = float(speed[_CHIN_SLOT]) / chin_frames
+
+        # Dropped frames: displacement spans several frames, keep per-frame speed
+        if frames_elapsed > 1:
+            speed /= frames_elapsed
+
+        velocities = {
+            hand_label: float(speed[_TRACK_SLOTS[hand_label]]) for hand_label in labels
+        }
+        return velocities, chin_speed
 
-    def update_velocity_tracking(self, fingertip_positions: Dict, chin_position: Optional[Dict]):
+    def update_velocity_tracking(self):
         """
-        Update velocity tracking with current positions.
-
-        Args:
-            fingertip_positions: Current fingertip positions
-            chin_position: Current chin position
+        Keep the points measured by calculate_velocities for the next frame
+        Swaps the current/previous buffers; calculate_velocities refills every
+        seen row and unseen rows are masked out
         """
-        self.prev_fingertip_positions = fingertip_positions.copy() if fingertip_positions else {}
-        self.prev_chin_position = chin_position.copy() if chin_position else None
+        self._track_prev, self._track_curr = self._track_curr, self._track_prev
+        self._prev_seen, self._track_seen = self._track_seen, self._prev_seen
 
     def draw_landmarks(self, frame: np.ndarray, hand_results, face_results) -> np.ndarray:
         """
         Draw hand landmarks on the frame.
 
         Args:
-            frame: Video frame (already flipped)
+            frame: BGR video frame (unmirrored, as returned by process_frame)
             hand_results: MediaPipe hand results
             face_results: MediaPipe face results
 
@@ -295,6 +613,7 @@ class HandTracker:
 
     def cleanup(self):
         """Release MediaPipe resources"""
+        self._face_pool.shutdown(wait=True)
         self.hands.close()
         self.face_mesh.close()
         print("Hand and face tracker cleaned up")
\ No newline at end of file
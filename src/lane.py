@@ -4,8 +4,41 @@ Manages the 3 instrument zones (Kick, Snare, Hi-Hat) with visual effects
 """
 
 import pygame
+import numpy as np
 from typing import Tuple
-from config.constants import ZONES, COLOR_ZONE_INACTIVE, COLOR_ZONE_ACTIVE, COLOR_ZONE_HIT
+from config.constants import (
+    ZONES, COLOR_ZONE_INACTIVE, COLOR_ZONE_ACTIVE, COLOR_ZONE_HIT, SCREEN_WIDTH,
+    IMAGE_KICK, IMAGE_SNARE, IMAGE_HIHAT
+)
+
+# Glow intensity steps with a pre-rendered border/glow surface each
+GLOW_LEVELS = 16
+
+# Instrument icon per lane
+IMAGE_MAP = {
+    'kick': IMAGE_KICK,
+    'hihat': IMAGE_HIHAT,
+    'snare': IMAGE_SNARE
+}
+
+
+def boxes_overlap(boxes: np.ndarray, rects: np.ndarray) -> np.ndarray:
+    """
+    Test every box against every rect in one broadcast
+    COLLISION DETECTION: Same strict-overlap rule as pygame.Rect.colliderect
+    for non-empty boxes
+
+    Args:
+        boxes: (N, 4) array of x0, y0, x1, y1
+        rects: (Z, 4) array of x0, y0, x1, y1
+
+    Returns:
+        (Z, N) bool array, True where box n overlaps rect z
+    """
+    return (
+        (boxes[None, :, 0] < rects[:, None, 2]) & (rects[:, None, 0] < boxes[None, :, 2]) &
+        (boxes[None, :, 1] < rects[:, None, 3]) & (rects[:, None, 1] < boxes[None, :, 3])
+    )
 
 
 class Lane:
@@ -27,9 +60,10 @@ class Lane:
         self.y = zone_config['y']
         self.width = zone_config['width']
         self.height = zone_config['height']
+        self.x2 = self.x + self.width
+        self.y2 = self.y + self.height
 
         # Visual coordinates (inverted X for display to match flipped video)
-        from config.constants import SCREEN_WIDTH
         self.visual_x = SCREEN_WIDTH - self.x - self.width
 
         self.color = zone_config['color']
@@ -47,6 +81,9 @@ class Lane:
             self.image = None
             print(f"[WARNING] Could not load image: {image_path}")
 
+        # Instrument label never changes: render it once
+        self.label_surface = pygame.font.Font(None, 32).render(self.name, True, (255, 255, 255))
+
         # State
         self.is_active = False  # Hand is in zone
         self.is_hit = False     # Just hit
@@ -56,6 +93,68 @@ class Lane:
         self.glow_intensity = 0.0  # 0.0 to 1.0
         self.border_thickness = 3
 
+        # Blit list for the last visual state (rebuilt only when it changes)
+        self._state_key = None
+        self._batch = []
+
+        # Zone shapes only depend on the lane color: draw them once
+        self._build_surfaces()
+
+        # Fixed blit positions (visual X, inverted to match flipped video)
+        self._zone_pos = (self.visual_x, self.y)
+        self._glow_pos = (self.visual_x - 20, self.y - 20)
+        self._label_pos = self.label_surface.get_rect(
+            center=(self.visual_x + self.width // 2, self.y + 30)
+        ).topleft
+        if self.image:
+            self._image_pos = (
+                self.visual_x + (self.width - self.image.get_width()) // 2,
+                self.y + (self.height - self.image.get_height()) // 2 + 20
+            )
+
+    def _build_surfaces(self):
+        """
+        Pre-render the zone background, border and glow surfaces
+        Border and glow depend on the glow intensity, which is quantized to
+        GLOW_LEVELS steps; alpha is baked in because surface alpha on a
+        per-pixel-alpha surface takes pygame's slow blit path
+        """
+        zone_rect = (0, 0, self.width, self.height)
+
+        # Background per state alpha (idle / active / hit)
+        self._bg_surfaces = {}
+        for alpha in (40, 120, 200):
+            surface = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
+            pygame.draw.rect(surface, (*self.color, alpha), zone_rect, border_radius=15)
+            self._bg_surfaces[alpha] = surface
+
+        self._border_surfaces = []
+        self._glow_surfaces = []
+        for level in range(GLOW_LEVELS + 1):
+            intensity = level / GLOW_LEVELS
+
+            # Border: thicker and more opaque with glow
+            border_surface = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
+            border_color = (*self.color, int(100 + (intensity * 155)))
+            thickness = int(self.border_thickness + intensity * 3)
+            pygame.draw.rect(border_surface, border_color, zone_rect,
+                            width=thickness, border_radius=15)
+            self._border_surfaces.append(border_surface)
+
+            # Multiple layers for glow
+            glow_surface = pygame.Surface((self.width + 40, self.height + 40), pygame.SRCALPHA)
+            for i in range(5):
+                alpha = int(intensity * 30 * (5 - i) / 5)
+                offset = i * 8
+                pygame.draw.rect(
+                    glow_surface,
+                    (*self.color, alpha),
+                    (offset, offset, self.width + 40 - offset * 2, self.height + 40 - offset * 2),
+                    width=2,
+                    border_radius=20
+                )
+            self._glow_surfaces.append(glow_surface)
+
     def update(self, dt: float):
         """
         Update lane state and animations
@@ -93,72 +192,70 @@ class Lane:
         Args:
             screen: Pygame surface to draw on
         """
-        # Create surface for zone
-        zone_surface = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
+        batch = []
+        self.collect_blits(batch)
+        screen.blits(batch, doreturn=False)
+
+    def state_key(self) -> tuple:
+        """
+        Visual state of the lane: frames with the same key draw
+        the same surfaces at the same positions
+
+        Returns:
+            Tuple of (is_hit, is_active, glow level, glow shown)
+        """
+        glow_level = round(self.glow_intensity * GLOW_LEVELS)
+        return (self.is_hit, self.is_active, glow_level, self.glow_intensity > 0.3)
+
+    def collect_blits(self, batch: list):
+        """
+        Append the lane's (surface, position) pairs in draw order
+
+        Args:
+            batch: Blit list for Surface.blits
+        """
+        key = self.state_key()
+        if key != self._state_key:
+            self._state_key = key
+            self._batch = self._build_batch(*key)
+        batch.extend(self._batch)
+
+    def _build_batch(self, is_hit: bool, is_active: bool, glow_level: int, show_glow: bool) -> list:
+        """
+        Look up the pre-rendered surfaces for one visual state
+
+        Args:
+            is_hit: Hit flash is running
+            is_active: Hand is in zone
+            glow_level: Quantized glow intensity (0..GLOW_LEVELS)
+            show_glow: Draw the outer glow layers
 
+        Returns:
+            List of (surface, position) pairs in draw order
+        """
         # Determine alpha based on state
-        if self.is_hit:
+        if is_hit:
             alpha = 200
-        elif self.is_active:
+        elif is_active:
             alpha = 120
         else:
             alpha = 40
 
-        # Background fill with color and alpha
-        bg_color = (*self.color, alpha)
-        pygame.draw.rect(zone_surface, bg_color, (0, 0, self.width, self.height), border_radius=15)
+        # Background, then border for the current glow step
+        batch = [
+            (self._bg_surfaces[alpha], self._zone_pos),
+            (self._border_surfaces[glow_level], self._zone_pos)
+        ]
 
-        # Use visual_x for rendering (inverted to match flipped video)
-        render_x = self.visual_x
-
-        # Blit zone surface to screen at visual position
-        screen.blit(zone_surface, (render_x, self.y))
-
-        # Draw border
-        border_alpha = int(100 + (self.glow_intensity * 155))
-        border_color = (*self.color, border_alpha)
-
-        # Create border surface
-        border_surface = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-        thickness = int(self.border_thickness + self.glow_intensity * 3)
-        pygame.draw.rect(border_surface, border_color, (0, 0, self.width, self.height),
-                        width=thickness, border_radius=15)
-        screen.blit(border_surface, (render_x, self.y))
-
-        # Draw instrument image
+        # Instrument image and label
         if self.image:
-            img_x = render_x + (self.width - self.image.get_width()) // 2
-            img_y = self.y + (self.height - self.image.get_height()) // 2 + 20
-            screen.blit(self.image, (img_x, img_y))
-
-        # Draw label
-        font = pygame.font.Font(None, 32)
-        text = font.render(self.name, True, (255, 255, 255))
-        text_rect = text.get_rect(center=(render_x + self.width // 2, self.y + 30))
-        screen.blit(text, text_rect)
+            batch.append((self.image, self._image_pos))
+        batch.append((self.label_surface, self._label_pos))
 
         # Glow effect when active
-        if self.glow_intensity > 0.3:
-            self._draw_glow(screen)
-
-    def _draw_glow(self, screen: pygame.Surface):
-        """Draw glow effect around zone"""
-        glow_surface = pygame.Surface((self.width + 40, self.height + 40), pygame.SRCALPHA)
-
-        # Multiple layers for glow
-        for i in range(5):
-            alpha = int(self.glow_intensity * 30 * (5 - i) / 5)
-            glow_color = (*self.color, alpha)
-            offset = i * 8
-            pygame.draw.rect(
-                glow_surface,
-                glow_color,
-                (offset, offset, self.width + 40 - offset * 2, self.height + 40 - offset * 2),
-                width=2,
-                border_radius=20
-            )
-
-        screen.blit(glow_surface, (self.visual_x - 20, self.y - 20))
+        if show_glow:
+            batch.append((self._glow_surfaces[glow_level], self._glow_pos))
+        return batch
 
     def get_rect(self) -> pygame.Rect:
         """Get pygame Rect for collision detection"""
@@ -174,11 +271,10 @@ class Lane:
         Returns:
             True if hand is in this lane
         """
-        lane_rect = self.get_rect()
-        hand_rect = pygame.Rect(hand_bbox['x'], hand_bbox['y'],
-                               hand_bbox['width'], hand_bbox['height'])
-
-        return lane_rect.colliderect(hand_rect)
+        # Strict overlap on ints, same rule as boxes_overlap
+        x, y = hand_bbox['x'], hand_bbox['y']
+        return (x < self.x2 and self.x < x + hand_bbox['width'] and
+                y < self.y2 and self.y < y + hand_bbox['height'])
 
 
 class LaneManager:
@@ -186,23 +282,25 @@ class LaneManager:
 
     def __init__(self):
         """Initialize all lanes with their respective images"""
-        from config.constants import IMAGE_KICK, IMAGE_SNARE, IMAGE_HIHAT
-
         self.lanes = []
 
         # Create lanes for each zone
         for zone in ZONES:
-            # Map instrument to image path
-            image_map = {
-                'kick': IMAGE_KICK,
-                'hihat': IMAGE_HIHAT,
-                'snare': IMAGE_SNARE
-            }
-
-            image_path = image_map.get(zone['instrument'])
+            image_path = IMAGE_MAP.get(zone['instrument'])
             lane = Lane(zone, image_path)
             self.lanes.append(lane)
 
+        # Lane rectangles (x0, y0, x1, y1) and chin lanes for vectorized collision
+        self._rects = np.array(
+            [(lane.x, lane.y, lane.x2, lane.y2) for lane in self.lanes],
+            dtype=np.int32
+        )
+        self._chin_lanes = np.array([lane.instrument == 'hihat' for lane in self.lanes])
+
+        # Combined blit list, rebuilt only when a lane's visual state changes
+        self._last_keys = None
+        self._batch = []
+
         print(f"[OK] Created {len(self.lanes)} lanes")
 
     def update(self, dt: float):
@@ -211,9 +309,18 @@ class LaneManager:
             lane.update(dt)
 
     def render(self, screen: pygame.Surface):
-        """Render all lanes"""
-        for lane in self.lanes:
-            lane.render(screen)
+        """
+        Render all lanes with a single blits call
+        Lanes sit on the live camera feed, so they are drawn every frame; only
+        the blit list is retained between frames with unchanged lane states
+        """
+        keys = [lane.state_key() for lane in self.lanes]
+        if keys != self._last_keys:
+            self._last_keys = keys
+            self._batch = []
+            for lane in self.lanes:
+                lane.collect_blits(self._batch)
+        screen.blits(self._batch, doreturn=False)
 
     def get_lane_by_instrument(self, instrument: str) -> Lane:
         """Get lane by instrument name"""
@@ -222,81 +329,111 @@ class LaneManager:
                 return lane
         return None
 
-    def check_collisions(self, fingertip_positions: dict, chin_position: dict) -> dict:
+    def check_hits_vec(self, boxes: np.ndarray, speeds: np.ndarray, velocity_threshold: float) -> np.ndarray:
         """
-        Check which lanes are activated
-        Hi-Hat uses chin, Kick/Snare use fingertips
+        Test every lane against every tracked box in one broadcast (boxes_overlap)
+
+        Args:
+            boxes: (N, 4) array of x0, y0, x1, y1 per tracked point
+            speeds: (N,) array of speeds in pixels per frame
+            velocity_threshold: Minimum speed required for valid hit
+
+        Returns:
+            (n_lanes, N) bool array, True where the box overlaps the lane
+            and is moving fast enough
+        """
+        return boxes_overlap(boxes, self._rects) & (speeds >= velocity_threshold)[None, :]
+
+    def _activate_lanes(self, fingertip_positions, chin_position: dict,
+                        fingertip_velocities: dict, chin_velocity: float,
+                        velocity_threshold: float, use_chin: bool) -> dict:
+        """
+        Resolve lane activation for all lanes and tracked points at once
 
         Args:
-            fingertip_positions: Dict of fingertip zones {'Left': {...}, 'Right': {...}}
+            fingertip_positions: FingertipZones, one (x, y, w, h, cx, cy) row per hand
             chin_position: Dict with chin zone or None
+            fingertip_velocities: Dict of fingertip velocities
+            chin_velocity: Chin velocity
+            velocity_threshold: Minimum speed required for valid hit
+            use_chin: Hi-Hat is hit with the chin (False: with a fingertip)
 
         Returns:
             Dict of {instrument: label} for active lanes
         """
-        active_lanes = {}
+        labels = fingertip_positions.labels
+        n_hands = len(labels)
+        n_points = n_hands + (1 if chin_position else 0)
 
-        for lane in self.lanes:
-            lane_active = False
+        active_lanes = {}
+        if not n_points:
+            for lane in self.lanes:
+                lane.activate(False)
+            return active_lanes
+
+        # Fingertip rows first, chin (if any) last
+        boxes = np.empty((n_points, 4), dtype=np.int32)
+        speeds = np.empty(n_points, dtype=np.float32)
+        zones = fingertip_positions.data
+        boxes[:n_hands, :2] = zones[:, :2]
+        np.add(zones[:, :2], zones[:, 2:4], out=boxes[:n_hands, 2:])
+        speeds[:n_hands] = [fingertip_velocities.get(label, -np.inf) for label in labels]
+        if chin_position:
+            x, y = chin_position['x'], chin_position['y']
+            boxes[n_hands] = (x, y, x + chin_position['width'], y + chin_position['height'])
+            speeds[n_hands] = chin_velocity
+
+        hits = self.check_hits_vec(boxes, speeds, velocity_threshold)
+
+        # Chin lanes only accept the chin column, the others only fingertips
+        is_chin = np.arange(n_points) >= n_hands
+        chin_lanes = self._chin_lanes if use_chin else np.zeros_like(self._chin_lanes)
+        hits &= chin_lanes[:, None] == is_chin[None, :]
+
+        # First matching point per lane wins (same order as the per-lane scan)
+        lane_hit = hits.any(axis=1)
+        first = hits.argmax(axis=1)
+        for k, lane in enumerate(self.lanes):
+            if lane_hit[k]:
+                active_lanes[lane.instrument] = labels[first[k]] if first[k] < n_hands else 'Chin'
+            lane.activate(bool(lane_hit[k]))
 
-            # Hi-Hat uses chin detection
-            if lane.instrument == 'hihat':
-                if chin_position and lane.check_hand_collision(chin_position):
-                    lane_active = True
-                    active_lanes[lane.instrument] = 'Chin'
+        return active_lanes
 
-            # Kick and Snare use fingertip detection
-            else:
-                for hand_label, fingertip_zone in fingertip_positions.items():
-                    if lane.check_hand_collision(fingertip_zone):
-                        lane_active = True
-                        active_lanes[lane.instrument] = hand_label
-                        break
+    def check_collisions(self, fingertip_positions, chin_position: dict) -> dict:
+        """
+        Check which lanes are activated
+        Hi-Hat uses chin, Kick/Snare use fingertips
 
-            lane.activate(lane_active)
+        Args:
+            fingertip_positions: FingertipZones for the Left/Right hands
+            chin_position: Dict with chin zone or None
 
-        return active_lanes
+        Returns:
+            Dict of {instrument: label} for active lanes
+        """
+        # No velocity gate: every tracked point passes a -inf threshold
+        return self._activate_lanes(fingertip_positions, chin_position, {}, 0.0, -np.inf, True)
 
-    def check_collisions_with_velocity(self, fingertip_positions: dict, chin_position: dict,
+    def check_collisions_with_velocity(self, fingertip_positions, chin_position: dict,
                                        fingertip_velocities: dict, chin_velocity: float,
-                                       velocity_threshold: float) -> dict:
+                                       velocity_threshold: float, use_chin: bool = True) -> dict:
         """
         Check which lanes are activated WITH velocity check for gesture detection.
         Prevents "idle farming" - player must MOVE FAST to hit!
 
         Args:
-            fingertip_positions: Dict of fingertip zones
+            fingertip_positions: FingertipZones for the Left/Right hands
             chin_position: Dict with chin zone or None
             fingertip_velocities: Dict of fingertip velocities
             chin_velocity: Chin velocity
             velocity_threshold: Minimum speed required for valid hit
+            use_chin: Hi-Hat is hit with the chin (False: with a fingertip)
 
         Returns:
             Dict of {instrument: label} for active lanes
         """
-        active_lanes = {}
-
-        for lane in self.lanes:
-            lane_active = False
-
-            # Hi-Hat uses chin detection WITH velocity check
-            if lane.instrument == 'hihat':
-                if chin_position and lane.check_hand_collision(chin_position):
-                    # Check velocity - must be moving fast enough!
-                    if chin_velocity >= velocity_threshold:
-                        lane_active = True
-                        active_lanes[lane.instrument] = 'Chin'
-
-            # Kick and Snare use fingertip detection WITH velocity check
-            else:
-                for hand_label, fingertip_zone in fingertip_positions.items():
-                    if lane.check_hand_collision(fingertip_zone):
-                        # Check velocity - must be moving fast enough!
-                        if hand_label in fingertip_velocities and fingertip_velocities[hand_label] >= velocity_threshold:
-                            lane_active = True
-                            active_lanes[lane.instrument] = hand_label
-                            break
-
-            lane.activate(lane_active)
-
-        return active_lanes
+        return self._activate_lanes(
+            fingertip_positions, chin_position, fingertip_velocities,
+            chin_velocity, velocity_threshold, use_chin
+        )
@@ -3,9 +3,14 @@ Score Manager - Scoring and Combo System
 Tracks score, combo, accuracy, and statistics
 """
 
+from bisect import bisect_right
 from typing import Dict
 from config.constants import COMBO_MULTIPLIER
 
+# Combo thresholds in ascending order and the multiplier each one unlocks
+_COMBO_THRESHOLDS = sorted(COMBO_MULTIPLIER)
+_COMBO_MULTIPLIERS = [COMBO_MULTIPLIER[threshold] for threshold in _COMBO_THRESHOLDS]
+
 
 class ScoreManager:
     """
@@ -65,6 +70,20 @@ class ScoreManager:
         self.miss_count += 1
         self.current_multiplier = 1.0
 
+    def add_misses(self, count: int):
+        """
+        Process several misses at once (breaks combo)
+
+        Args:
+            count: Number of notes missed
+        """
+        if count <= 0:
+            return
+
+        self.combo = 0
+        self.miss_count += count
+        self.current_multiplier = 1.0
+
     def _get_combo_multiplier(self) -> float:
         """
         Calculate combo multiplier based on current combo
@@ -72,14 +91,9 @@ class ScoreManager:
         Returns:
             Multiplier value (1.0 to 2.5+)
         """
-        # Get highest applicable multiplier
-        applicable_multiplier = 1.0
-
-        for combo_threshold, multiplier in sorted(COMBO_MULTIPLIER.items()):
-            if self.combo >= combo_threshold:
-                applicable_multiplier = multiplier
-
-        return applicable_multiplier
+        # Highest threshold reached (binary search over the sorted thresholds)
+        index = bisect_right(_COMBO_THRESHOLDS, self.combo) - 1
+        return _COMBO_MULTIPLIERS[index] if index >= 0 else 1.0
 
     def get_accuracy(self) -> float:
         """
@@ -4,9 +4,11 @@ VIDEO PROCESSING: Renders camera feed with overlay graphics
 Displays score, combo, falling objects, and hit feedback
 """
 
+import math
 import pygame
 import cv2
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 from config.constants import (
     SCREEN_WIDTH, SCREEN_HEIGHT,
     TOPBAR_HEIGHT, TOPBAR_PADDING,
@@ -17,6 +19,19 @@ from config.constants import (
 )
 from config.settings import GameSettings
 
+# Rendered text surfaces kept by _render_text (oldest evicted first)
+TEXT_CACHE_SIZE = 64
+
+# Combo counter color while there is no combo
+COLOR_COMBO_ZERO = (100, 100, 100)
+
+# 32-bit display channel masks (R, G, B) -> conversion from the BGR camera buffer
+# (little-endian: R mask 0xFF0000 means bytes are stored B, G, R, X)
+_BGR_TO_DISPLAY = {
+    (0xFF0000, 0x00FF00, 0x0000FF): cv2.COLOR_BGR2BGRA,
+    (0x0000FF, 0x00FF00, 0xFF0000): cv2.COLOR_BGR2RGBA,
+}
+
 
 class GameScreen:
     """
@@ -38,6 +53,39 @@ class GameScreen:
         self.combo_font = pygame.font.Font(None, 56)
         self.timer_font = pygame.font.Font(None, 42)
         self.feedback_font = pygame.font.Font(None, 72)
+        self.chin_font = pygame.font.Font(None, 20)
+        self.small_font = pygame.font.Font(None, 24)     # Hand labels, multiplier
+        self.countdown_font = pygame.font.Font(None, 200)
+        self.ready_font = pygame.font.Font(None, 48)
+
+        # Rendered text by (font, text, color): score, multiplier and labels
+        # rarely change, so most frames reuse a surface
+        self._text_cache = {}
+
+        # Top bar (surface, position) pairs, rebuilt only when their value changes
+        self._score_key = None
+        self._score_blit = None
+        self._mult_key = None
+        self._mult_blit = None
+        self._timer_rect = pygame.Rect(0, 0, 0, 0)
+
+        # Combo digit atlas: the combo is drawn glyph by glyph from these,
+        # so its ever-growing value never reaches FreeType or the text cache
+        glyphs = "0123456789x"
+        self._combo_glyphs = {
+            color: {char: self.combo_font.render(char, True, color) for char in glyphs}
+            for color in (COLOR_COMBO, COLOR_COMBO_ZERO)
+        }
+        self._combo_key = None
+        self._combo_blits = []
+
+        # Countdown caption never changes: render it once
+        self._ready_text = self.ready_font.render("Get Ready!", True, (200, 200, 200))
+        self._ready_rect = self._ready_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 150))
+
+        # Timer surface, re-rendered only when the displayed second changes
+        self._timer_key = None
+        self._timer_surface = None
 
         # Feedback display
         self.feedback_text = ""
@@ -45,21 +93,60 @@ class GameScreen:
         self.feedback_timer = 0
         self.feedback_position = (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 100)
 
+        # Two persistent BGR buffers the camera frame is composed into, and the
+        # camera surfaces they are shown through (see _create_camera_surface):
+        # the front pair is on screen while the next frame goes into the back
+        # VIDEO PROCESSING: frames are written in place, no per-frame Surface
+        self._cam_buffers = [
+            np.zeros((SCREEN_HEIGHT, SCREEN_WIDTH, 3), dtype=np.uint8) for _ in range(2)
+        ]
+        cam_surfaces = [self._create_camera_surface(buffer) for buffer in self._cam_buffers]
+        self._cam_surfaces = [surface for surface, _ in cam_surfaces]
+        self._cam_convert = cam_surfaces[0][1]
+        self._cam_front = 0
+
+        # Camera frames are composed on a worker thread (the cv2 calls release
+        # the GIL), one at a time; _cam_job is the pending back-buffer compose
+        self._cam_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix='camera_feed')
+        self._cam_job = None
+
+        # Translucent feed: the only thing under it is the COLOR_BG fill, so
+        # the blend is applied to the BGR buffer and the surface stays opaque
+        # (surface alpha would put the full-screen blit on SDL's blend path)
+        self._cam_alpha = int(255 * GameSettings.CAMERA_ALPHA) / 255
+        self._cam_backdrop = None
+        if self._cam_alpha < 1.0:
+            self._cam_backdrop = np.empty_like(self._cam_buffers[0])
+            self._cam_backdrop[:] = COLOR_BG[::-1]
+
+        # Newest camera frame handed to the compose worker
+        self._cam_frame = None
+
+        # Scratch buffer for the aspect-fill resize before cropping
+        # (allocated on first use, size depends on the camera)
+        self._resize_buffer = None
+
+        # Aspect-fill geometry for the last camera size (see _feed_geometry)
+        self._feed_size = None
+        self._feed_layout = None
+
     def render(self, camera_frame, score_manager, game_time, total_time, fingertip_positions=None, chin_position=None):
         """
         Render complete game screen
         VIDEO PROCESSING: Composite video and graphics
 
         Args:
-            camera_frame: OpenCV frame from camera (BGR)
+            camera_frame: Unmirrored BGR camera frame
             score_manager: ScoreManager instance
             game_time: Current game time in seconds
             total_time: Total game duration
             fingertip_positions: Dict of fingertip zones
             chin_position: Dict with chin zone or None
         """
-        # Background
-        self.screen.fill(COLOR_BG)
+        # Background (the camera feed covers every pixel of it and already
+        # has it blended in when translucent)
+        if camera_frame is None or camera_frame.size == 0:
+            self.screen.fill(COLOR_BG)
 
         # Render camera feed as background
         # VIDEO PROCESSING: Convert camera frame to pygame surface
@@ -81,67 +168,39 @@ class GameScreen:
         """
         Render camera feed to screen using ASPECT FILL (ZOOM TO COVER).
         VIDEO PROCESSING: Aggressively resize and center-crop to fill entire screen.
+        Each camera frame is composed once, on a worker thread, into the back
+        surface (_compose_camera_frame) and shown from the next frame on.
 
         Args:
-            frame: OpenCV BGR frame
+            frame: BGR camera frame (unmirrored)
             fingertip_positions: Dict of fingertip zones
             chin_position: Dict with chin zone or None
         """
-        # VIDEO PROCESSING: Convert BGR to RGB
-        frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-
-        # Target dimensions (fullscreen)
-        target_width = SCREEN_WIDTH   # 1280
-        target_height = SCREEN_HEIGHT # 720
-
         # Source dimensions
-        src_h, src_w = frame_rgb.shape[:2]
+        src_h, src_w = frame.shape[:2]
 
         if src_w == 0 or src_h == 0:
             return
 
-        # Calculate scale ratios
-        scale_w = target_width / src_w
-        scale_h = target_height / src_h
-
-        # Use max scale to ensure image covers screen
-        scale = max(scale_w, scale_h)
-
-        # Calculate new dimensions after scaling
-        new_w = int(src_w * scale)
-        new_h = int(src_h * scale)
-
-        # Ensure dimensions are AT LEAST target size (add 1 pixel if needed to avoid rounding errors)
-        if new_w < target_width:
-            new_w = target_width
-        if new_h < target_height:
-            new_h = target_height
-
-        # Resize frame with the calculated scale
-        frame_resized = cv2.resize(frame_rgb, (new_w, new_h), interpolation=cv2.INTER_LINEAR)
-
-        # Center-crop: Calculate crop offsets to center the image
-        crop_x = max(0, (new_w - target_width) // 2)
-        crop_y = max(0, (new_h - target_height) // 2)
-
-        # Crop to EXACT target dimensions
-        frame_cropped = frame_resized[crop_y:crop_y + target_height, crop_x:crop_x + target_width]
+        # A finished compose becomes the front surface
+        if self._cam_job is not None and self._cam_job.done():
+            self._swap_camera_surface()
 
-        # Ensure output is EXACTLY the target size
-        actual_h, actual_w = frame_cropped.shape[:2]
-        if actual_w != target_width or actual_h != target_height:
-            frame_cropped = cv2.resize(frame_cropped, (target_width, target_height), interpolation=cv2.INTER_LINEAR)
+        # Compose a new frame into the back surface while this one is shown
+        # The game renders faster than the camera delivers, so repeated frames
+        # are not converted again (frames are fresh arrays from retrieve() and
+        # never written to)
+        if frame is not self._cam_frame and self._cam_job is None:
+            first_frame = self._cam_frame is None
+            self._cam_frame = frame
+            self._cam_job = self._cam_pool.submit(self._compose_camera_frame, frame, 1 - self._cam_front)
 
-        # Convert to pygame surface
-        frame_transposed = np.transpose(frame_cropped, (1, 0, 2))
-        frame_surface = pygame.surfarray.make_surface(frame_transposed)
-
-        # Apply alpha/brightness if needed
-        if GameSettings.CAMERA_ALPHA < 1.0:
-            frame_surface.set_alpha(int(255 * GameSettings.CAMERA_ALPHA))
+            # Nothing composed yet: wait instead of showing an empty surface
+            if first_frame:
+                self._swap_camera_surface()
 
         # Blit to screen at (0, 0) for fullscreen camera
-        self.screen.blit(frame_surface, (0, 0))
+        self.screen.blit(self._cam_surfaces[self._cam_front], (0, 0))
 
         # Draw fingertip indicators (for Kick and Snare)
         if fingertip_positions:
@@ -151,6 +210,61 @@ class GameScreen:
         if chin_position:
             self._draw_chin_indicator(chin_position)
 
+    def _swap_camera_surface(self):
+        """Wait for the pending compose and show its surface"""
+        job, self._cam_job = self._cam_job, None
+        job.result()  # Re-raise errors from the worker thread
+        self._cam_front = 1 - self._cam_front
+
+    def _compose_camera_frame(self, frame, index: int):
+        """
+        Write a camera frame into one of the camera surfaces
+        VIDEO PROCESSING: aspect-fill resize, center-crop and mirror into the
+        BGR buffer, then one conversion pass into the surface pixels
+        Runs on the camera feed worker; the buffer/surface pair must not be
+        the one on screen
+
+        Args:
+            frame: BGR camera frame (unmirrored, non-empty)
+            index: Buffer/surface pair to write
+        """
+        cam_buffer = self._cam_buffers[index]
+        src_h, src_w = frame.shape[:2]
+
+        new_w, new_h, crop_x, crop_y, interpolation = self._feed_geometry(src_w, src_h)
+
+        if src_w == SCREEN_WIDTH and src_h == SCREEN_HEIGHT:
+            # Already screen-sized: mirror straight into the surface buffer
+            cv2.flip(frame, 1, dst=cam_buffer)
+        elif new_w == SCREEN_WIDTH and new_h == SCREEN_HEIGHT:
+            # Same aspect ratio: resize into the surface buffer, mirror in place
+            cv2.resize(frame, (new_w, new_h), dst=cam_buffer, interpolation=interpolation)
+            cv2.flip(cam_buffer, 1, dst=cam_buffer)
+        else:
+            # Resize frame with the calculated scale into the reused scratch buffer
+            if self._resize_buffer is None or self._resize_buffer.shape[:2] != (new_h, new_w):
+                self._resize_buffer = np.empty((new_h, new_w, 3), dtype=np.uint8)
+            frame_resized = cv2.resize(frame, (new_w, new_h), dst=self._resize_buffer, interpolation=interpolation)
+
+            # Center-crop: exactly screen-sized since new_w/new_h cover the screen
+            frame_cropped = frame_resized[crop_y:crop_y + SCREEN_HEIGHT, crop_x:crop_x + SCREEN_WIDTH]
+
+            # Mirror into the buffer backing the persistent surface
+            cv2.flip(frame_cropped, 1, dst=cam_buffer)
+
+        # Blend over the background (translucent feed only)
+        if self._cam_backdrop is not None:
+            cv2.addWeighted(cam_buffer, self._cam_alpha, self._cam_backdrop,
+                            1.0 - self._cam_alpha, 0.0, dst=cam_buffer)
+
+        # Copy into the display-format surface (one channel-order pass);
+        # the pixel view locks the surface, so drop it before blitting
+        if self._cam_convert is not None:
+            pixels = np.frombuffer(self._cam_surfaces[index].get_view('1'), dtype=np.uint8)
+            cv2.cvtColor(cam_buffer, self._cam_convert,
+                         dst=pixels.reshape(SCREEN_HEIGHT, SCREEN_WIDTH, 4))
+            del pixels
+
     def _draw_fingertip_indicators(self, fingertip_zones):
         """
         Draw fingertip detection indicators
@@ -171,6 +285,72 @@ class GameScreen:
             # Draw inner dot (exact fingertip position)
             pygame.draw.circle(self.screen, color, (center_x, center_y), 5, -1)
 
+    def _create_camera_surface(self, cam_buffer: np.ndarray) -> tuple:
+        """
+        Create a camera surface in the display's pixel format
+        VIDEO PROCESSING: With matching formats SDL blits (and alpha-blends)
+        on its fast path; a 24-bit BGR source with surface alpha is several
+        times slower per frame than the extra channel-order pass
+
+        Args:
+            cam_buffer: Screen-sized BGR buffer the frames are composed into
+
+        Returns:
+            Tuple of (surface, cv2 conversion code from the BGR buffer), the
+            code is None when the surface shares memory with the BGR buffer
+        """
+        surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert(self.screen)
+        convert = None
+        if surface.get_bytesize() == 4 and surface.get_pitch() == SCREEN_WIDTH * 4:
+            convert = _BGR_TO_DISPLAY.get(surface.get_masks()[:3])
+
+        if convert is None:
+            # Unusual display format: show the BGR buffer directly
+            surface = pygame.image.frombuffer(cam_buffer, (SCREEN_WIDTH, SCREEN_HEIGHT), 'BGR')
+
+        return surface, convert
+
+    def _feed_geometry(self, src_w: int, src_h: int) -> tuple:
+        """
+        Aspect-fill (zoom to cover) layout for a camera size, cached per size
+        The axis that sets the scale maps exactly onto the screen; the other is
+        rounded up, so the center crop is always exactly screen-sized
+        Near 1:1 the feed is resized with nearest neighbour (several times
+        cheaper than bilinear and indistinguishable at that scale), unless
+        GameSettings.CAMERA_RESIZE_INTERP overrides it
+
+        Args:
+            src_w: Camera frame width
+            src_h: Camera frame height
+
+        Returns:
+            Tuple of (resized width, resized height, crop x, crop y, cv2 interpolation)
+        """
+        if (src_w, src_h) != self._feed_size:
+            scale_w = SCREEN_WIDTH / src_w
+            scale_h = SCREEN_HEIGHT / src_h
+
+            # Use max scale to ensure image covers screen
+            if scale_w >= scale_h:
+                new_w = SCREEN_WIDTH
+                new_h = max(SCREEN_HEIGHT, math.ceil(src_h * scale_w))
+            else:
+                new_w = max(SCREEN_WIDTH, math.ceil(src_w * scale_h))
+                new_h = SCREEN_HEIGHT
+
+            interpolation = GameSettings.CAMERA_RESIZE_INTERP
+            if interpolation is None:
+                scale = max(scale_w, scale_h)
+                interpolation = cv2.INTER_NEAREST if 0.9 < scale < 1.1 else cv2.INTER_LINEAR
+
+            self._feed_size = (src_w, src_h)
+            self._feed_layout = (
+                new_w, new_h, (new_w - SCREEN_WIDTH) // 2, (new_h - SCREEN_HEIGHT) // 2,
+                interpolation
+            )
+
+        return self._feed_layout
+
     def _draw_chin_indicator(self, chin_zone):
         """
         Draw chin detection indicator (for Hi-Hat)
@@ -191,8 +371,7 @@ class GameScreen:
         pygame.draw.circle(self.screen, color, (center_x, center_y), 6, -1)
 
         # Draw label
-        font = pygame.font.Font(None, 20)
-        label = font.render("CHIN", True, color)
+        label = self._render_text(self.chin_font, "CHIN", color)
         label_rect = label.get_rect(center=(center_x, center_y - 35))
         self.screen.blit(label, label_rect)
 
@@ -222,8 +401,7 @@ class GameScreen:
             )
 
             # Draw label
-            font = pygame.font.Font(None, 24)
-            label = font.render(hand_label, True, color)
+            label = self._render_text(self.small_font, hand_label, color)
             self.screen.blit(label, (x, y - 25))
 
     def _render_top_bar(self, score_manager, game_time, total_time):
@@ -236,31 +414,91 @@ class GameScreen:
             total_time: Total duration in seconds
         """
         # No background for top bar - full video visibility
+        # Everything is collected into one blits call
+        blits = []
 
         # Score (left)
-        score_text = self.score_font.render(f"Score: {score_manager.score}", True, COLOR_SCORE)
-        self.screen.blit(score_text, (TOPBAR_PADDING, TOPBAR_PADDING))
+        if score_manager.score != self._score_key:
+            self._score_key = score_manager.score
+            score_text = self._render_text(self.score_font, f"Score: {score_manager.score}", COLOR_SCORE)
+            self._score_blit = (score_text, (TOPBAR_PADDING, TOPBAR_PADDING))
+        blits.append(self._score_blit)
 
         # Combo (center)
-        combo_color = COLOR_COMBO if score_manager.combo > 0 else (100, 100, 100)
-        combo_text = self.combo_font.render(f"{score_manager.combo}x", True, combo_color)
-        combo_rect = combo_text.get_rect(center=(SCREEN_WIDTH // 2, TOPBAR_HEIGHT // 2))
-        self.screen.blit(combo_text, combo_rect)
+        combo_color = COLOR_COMBO if score_manager.combo > 0 else COLOR_COMBO_ZERO
+        combo_key = (score_manager.combo, combo_color)
+        if combo_key != self._combo_key:
+            self._combo_key = combo_key
+            self._combo_blits = self._layout_combo(*combo_key)
+        blits += self._combo_blits
 
         # Multiplier indicator
         if score_manager.current_multiplier > 1.0:
-            mult_font = pygame.font.Font(None, 24)
-            mult_text = mult_font.render(f"x{score_manager.current_multiplier:.1f}", True, COLOR_COMBO)
-            mult_rect = mult_text.get_rect(center=(SCREEN_WIDTH // 2, TOPBAR_HEIGHT - 15))
-            self.screen.blit(mult_text, mult_rect)
+            if score_manager.current_multiplier != self._mult_key:
+                self._mult_key = score_manager.current_multiplier
+                mult_text = self._render_text(self.small_font, f"x{score_manager.current_multiplier:.1f}", COLOR_COMBO)
+                self._mult_blit = (mult_text, mult_text.get_rect(center=(SCREEN_WIDTH // 2, TOPBAR_HEIGHT - 15)))
+            blits.append(self._mult_blit)
 
         # Timer (right)
         remaining_time = max(0, total_time - game_time)
         minutes = int(remaining_time // 60)
         seconds = int(remaining_time % 60)
-        timer_text = self.timer_font.render(f"{minutes}:{seconds:02d}", True, COLOR_WHITE)
-        timer_rect = timer_text.get_rect(topright=(SCREEN_WIDTH - TOPBAR_PADDING, TOPBAR_PADDING))
-        self.screen.blit(timer_text, timer_rect)
+        if (minutes, seconds) != self._timer_key:
+            self._timer_key = (minutes, seconds)
+            self._timer_surface = self.timer_font.render(f"{minutes}:{seconds:02d}", True, COLOR_WHITE)
+            self._timer_rect.size = self._timer_surface.get_size()
+            self._timer_rect.topright = (SCREEN_WIDTH - TOPBAR_PADDING, TOPBAR_PADDING)
+        blits.append((self._timer_surface, self._timer_rect))
+
+        self.screen.blits(blits, doreturn=False)
+
+    def _layout_combo(self, combo: int, color: tuple) -> list:
+        """
+        Lay out the combo counter ("12x") from the digit atlas, centered in the top bar
+
+        Args:
+            combo: Current combo count
+            color: Glyph color (COLOR_COMBO or COLOR_COMBO_ZERO)
+
+        Returns:
+            List of (glyph surface, position) pairs for Surface.blits
+        """
+        text = f"{combo}x"
+        glyphs = self._combo_glyphs[color]
+        font = self.combo_font
+
+        # Each glyph ends where the measured prefix ends (keeps the font's
+        # kerning); size() only measures, nothing is rasterized
+        x = SCREEN_WIDTH // 2 - font.size(text)[0] // 2
+        y = TOPBAR_HEIGHT // 2 - font.get_height() // 2
+
+        blits = []
+        for i, char in enumerate(text):
+            glyph = glyphs[char]
+            offset = font.size(text[:i + 1])[0] - glyph.get_width()
+            blits.append((glyph, (x + offset, y)))
+        return blits
+
+    def _render_text(self, font: pygame.font.Font, text: str, color: tuple) -> pygame.Surface:
+        """
+        Render antialiased text, reusing the surface while the text is unchanged
+
+        Args:
+            font: Font to render with
+            text: Text string
+            color: Text color (RGB tuple)
+
+        Returns:
+            Rendered text surface (shared, do not draw onto it)
+        """
+        key = (font, text, color)
+        surface = self._text_cache.get(key)
+        if surface is None:
+            if len(self._text_cache) >= TEXT_CACHE_SIZE:
+                del self._text_cache[next(iter(self._text_cache))]
+            surface = self._text_cache[key] = font.render(text, True, color)
+        return surface
 
     def show_feedback(self, text: str, color: tuple, position=None):
         """
@@ -284,9 +522,11 @@ class GameScreen:
             # Calculate alpha based on timer (fade out)
             alpha = int(255 * min(1.0, self.feedback_timer * 2))
 
-            # Render text
-            feedback_surface = self.feedback_font.render(self.feedback_text, True, self.feedback_color)
-            feedback_surface.set_alpha(alpha)
+            # Render text (fade a copy: the cached surface is shared)
+            feedback_surface = self._render_text(self.feedback_font, self.feedback_text, self.feedback_color)
+            if alpha < 255:
+                feedback_surface = feedback_surface.copy()
+                feedback_surface.set_alpha(alpha)
 
             # Center on screen
             feedback_rect = feedback_surface.get_rect(center=self.feedback_position)
@@ -303,6 +543,18 @@ class GameScreen:
         if self.feedback_timer > 0:
             self.feedback_timer -= dt
 
+    def reset(self):
+        """Reset camera feed state so a new game never shows the last one's frame"""
+        if self._cam_job is not None:
+            self._cam_job.result()  # Let a pending compose finish before reuse
+            self._cam_job = None
+        self._cam_frame = None
+        self._cam_front = 0
+
+    def cleanup(self):
+        """Stop the camera feed worker"""
+        self._cam_pool.shutdown(wait=True)
+
     def render_countdown(self, count: int):
         """
         Render countdown before game starts
@@ -312,14 +564,10 @@ class GameScreen:
         """
         self.screen.fill(COLOR_BG)
 
-        # Countdown text
-        countdown_font = pygame.font.Font(None, 200)
-        text = countdown_font.render(str(count), True, COLOR_WHITE)
+        # Countdown text (one surface per digit, from the text cache)
+        text = self._render_text(self.countdown_font, str(count), COLOR_WHITE)
         text_rect = text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
         self.screen.blit(text, text_rect)
 
         # "Get Ready!" text
-        ready_font = pygame.font.Font(None, 48)
-        ready_text = ready_font.render("Get Ready!", True, (200, 200, 200))
-        ready_rect = ready_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 150))
-        self.screen.blit(ready_text, ready_rect)
+        self.screen.blit(self._ready_text, self._ready_rect)
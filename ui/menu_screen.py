@@ -38,12 +38,16 @@ class MenuScreen:
         # Load menu background image
         menu_image_path = os.path.join('assets', 'image', 'menu.png')
         try:
-            self.background_image = pygame.image.load(menu_image_path)
+            # convert() to the display format so the per-frame blit is a plain copy
+            self.background_image = pygame.image.load(menu_image_path).convert()
             self.background_image = pygame.transform.scale(self.background_image, (SCREEN_WIDTH, SCREEN_HEIGHT))
         except:
             print(f"Could not load menu background: {menu_image_path}")
             self.background_image = None
 
+        # Static text and option boxes
+        self._build_static_blits()
+
     def handle_events(self, events):
         """
         Handle menu input events
@@ -67,104 +71,129 @@ class MenuScreen:
 
     def render(self):
         """Render menu screen"""
+        # Background with the dark overlay already applied
+        self.screen.blit(self._background, (0, 0))
+
+        # Title, subtitle, instructions and difficulty options in one call
+        self.screen.blits(self._menu_blits[self.current_selection], doreturn=False)
+
+    def _build_static_blits(self):
+        """
+        Pre-render everything on the menu that does not depend on input
+        None of the menu strings change, so the dimmed background, text and
+        option boxes are drawn once here and render() only blits them
+        """
         # Background - use image if available, otherwise fill with color
+        self._background = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
         if self.background_image:
-            self.screen.blit(self.background_image, (0, 0))
+            self._background.blit(self.background_image, (0, 0))
         else:
-            self.screen.fill(COLOR_BG)
+            self._background.fill(COLOR_BG)
 
         # Semi-transparent dark overlay for better text visibility
         overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
         overlay.fill((0, 0, 0, 120))
-        self.screen.blit(overlay, (0, 0))
-
-        # Title with shadow
-        self._draw_text_with_shadow("HAND BEATS", self.title_font, COLOR_WHITE, (SCREEN_WIDTH // 2, 120), shadow_offset=4)
-
-        # Subtitle with shadow
-        self._draw_text_with_shadow("Gesture Rhythm Game", self.subtitle_font, (200, 200, 200), (SCREEN_WIDTH // 2, 180), shadow_offset=2)
-
-        # Difficulty selection
-        self._render_difficulty_options()
+        self._background.blit(overlay, (0, 0))
+
+        # Title and subtitle with shadow, instructions at the bottom
+        static_blits = (
+            self._text_with_shadow("HAND BEATS", self.title_font, COLOR_WHITE, (SCREEN_WIDTH // 2, 120), shadow_offset=4) +
+            self._text_with_shadow("Gesture Rhythm Game", self.subtitle_font, (200, 200, 200), (SCREEN_WIDTH // 2, 180), shadow_offset=2) +
+            self._text_with_shadow("Use UP/DOWN to select, ENTER to start", self.desc_font, (220, 220, 220), (SCREEN_WIDTH // 2, SCREEN_HEIGHT - 60), shadow_offset=2)
+        )
+
+        # (unselected, selected) blit lists per difficulty option
+        option_blits = [
+            (self._build_option_blits(i, difficulty, False), self._build_option_blits(i, difficulty, True))
+            for i, difficulty in enumerate(self.difficulties)
+        ]
+
+        # Complete blit list for each possible selection
+        self._menu_blits = []
+        for selection in range(len(self.difficulties)):
+            blits = list(static_blits)
+            for i, (unselected, selected) in enumerate(option_blits):
+                blits += selected if i == selection else unselected
+            self._menu_blits.append(blits)
+
+    def _build_option_blits(self, index, difficulty, is_selected):
+        """
+        Pre-render one difficulty option
 
-        # Instructions with shadow
-        self._draw_text_with_shadow("Use UP/DOWN to select, ENTER to start", self.desc_font, (220, 220, 220), (SCREEN_WIDTH // 2, SCREEN_HEIGHT - 60), shadow_offset=2)
+        Args:
+            index: Option position in the list
+            difficulty: Difficulty name
+            is_selected: Render the highlighted variant
 
-    def _render_difficulty_options(self):
-        """Render difficulty options"""
+        Returns:
+            List of (surface, position) pairs in draw order
+        """
         y_start = 300
         y_spacing = 100
-
-        for i, difficulty in enumerate(self.difficulties):
-            y = y_start + i * y_spacing
-
-            # Get difficulty settings
-            diff_settings = DifficultySettings.get_difficulty(difficulty)
-
-            # Highlight selected
-            is_selected = (i == self.current_selection)
-
-            if is_selected:
-                # Background box for selected with stronger opacity
-                box_width = 520
-                box_height = 85
-                box_x = (SCREEN_WIDTH - box_width) // 2
-                box_y = y - 33
-
-                # Shadow box
-                shadow_box = pygame.Surface((box_width + 10, box_height + 10), pygame.SRCALPHA)
-                shadow_box.fill((0, 0, 0, 100))
-                self.screen.blit(shadow_box, (box_x - 5, box_y - 5))
-
-                # Draw selection box with opacity
-                box_surface = pygame.Surface((box_width, box_height), pygame.SRCALPHA)
-                box_surface.fill((*diff_settings['color'], 220))
-                self.screen.blit(box_surface, (box_x, box_y))
-
-                # Border
-                pygame.draw.rect(
-                    self.screen,
-                    COLOR_WHITE,
-                    (box_x, box_y, box_width, box_height),
-                    width=4,
-                    border_radius=12
-                )
-
-                text_color = COLOR_WHITE
-                desc_color = (255, 255, 255)
-            else:
-                # Add semi-transparent background for unselected options
-                box_width = 480
-                box_height = 75
-                box_x = (SCREEN_WIDTH - box_width) // 2
-                box_y = y - 28
-
-                # Darker and more opaque background for better visibility
-                box_surface = pygame.Surface((box_width, box_height), pygame.SRCALPHA)
-                box_surface.fill((0, 0, 0, 200))  # More opaque black
-                self.screen.blit(box_surface, (box_x, box_y))
-
-                # Add subtle border for unselected
-                pygame.draw.rect(
-                    self.screen,
-                    (60, 60, 60),  # Dark gray border
-                    (box_x, box_y, box_width, box_height),
-                    width=2,
-                    border_radius=10
-                )
-
-                text_color = (255, 255, 255)  # White text for better contrast
-                desc_color = (200, 200, 200)  # Lighter description
-
-            # Difficulty name with shadow
-            self._draw_text_with_shadow(difficulty, self.option_font, text_color, (SCREEN_WIDTH // 2, y), shadow_offset=3)
-
-            # Description with shadow
-            self._draw_text_with_shadow(diff_settings['description'], self.desc_font, desc_color, (SCREEN_WIDTH // 2, y + 30), shadow_offset=2)
-
-    def _draw_text_with_shadow(self, text, font, color, position, shadow_offset=2):
+        y = y_start + index * y_spacing
+
+        # Get difficulty settings
+        diff_settings = DifficultySettings.get_difficulty(difficulty)
+
+        blits = []
+        if is_selected:
+            # Background box for selected with stronger opacity
+            box_width = 520
+            box_height = 85
+            box_x = (SCREEN_WIDTH - box_width) // 2
+            box_y = y - 33
+
+            # Shadow box
+            shadow_box = pygame.Surface((box_width + 10, box_height + 10), pygame.SRCALPHA)
+            shadow_box.fill((0, 0, 0, 100))
+            blits.append((shadow_box, (box_x - 5, box_y - 5)))
+
+            # Selection box with opacity, border drawn into it (opaque, so
+            # the result matches drawing it on the screen afterwards)
+            box_surface = pygame.Surface((box_width, box_height), pygame.SRCALPHA)
+            box_surface.fill((*diff_settings['color'], 220))
+            pygame.draw.rect(
+                box_surface,
+                COLOR_WHITE,
+                (0, 0, box_width, box_height),
+                width=4,
+                border_radius=12
+            )
+            blits.append((box_surface, (box_x, box_y)))
+
+            text_color = COLOR_WHITE
+            desc_color = (255, 255, 255)
+        else:
+            # Add semi-transparent background for unselected options
+            box_width = 480
+            box_height = 75
+            box_x = (SCREEN_WIDTH - box_width) // 2
+            box_y = y - 28
+
+            # Darker and more opaque background for better visibility,
+            # with a subtle dark gray border
+            box_surface = pygame.Surface((box_width, box_height), pygame.SRCALPHA)
+            box_surface.fill((0, 0, 0, 200))  # More opaque black
+            pygame.draw.rect(
+                box_surface,
+                (60, 60, 60),
+                (0, 0, box_width, box_height),
+                width=2,
+                border_radius=10
+            )
+            blits.append((box_surface, (box_x, box_y)))
+
+            text_color = (255, 255, 255)  # White text for better contrast
+            desc_color = (200, 200, 200)  # Lighter description
+
+        # Difficulty name and description with shadow
+        blits += self._text_with_shadow(difficulty, self.option_font, text_color, (SCREEN_WIDTH // 2, y), shadow_offset=3)
+        blits += self._text_with_shadow(diff_settings['description'], self.desc_font, desc_color, (SCREEN_WIDTH // 2, y + 30), shadow_offset=2)
+        return blits
+
+    def _text_with_shadow(self, text, font, color, position, shadow_offset=2):
         """
-        Draw text with shadow for better readability
+        Render text with shadow for better readability
 
         Args:
             text: Text to render
@@ -172,16 +201,18 @@ class MenuScreen:
             color: Text color (RGB tuple)
             position: (x, y) center position
             shadow_offset: Pixel offset for shadow
+
+        Returns:
+            List of (surface, rect) pairs: shadow first, then main text
         """
-        # Draw shadow (black)
+        # Shadow (black)
         shadow = font.render(text, True, (0, 0, 0))
         shadow_rect = shadow.get_rect(center=(position[0] + shadow_offset, position[1] + shadow_offset))
-        self.screen.blit(shadow, shadow_rect)
 
-        # Draw main text
+        # Main text
         main_text = font.render(text, True, color)
         main_rect = main_text.get_rect(center=position)
-        self.screen.blit(main_text, main_rect)
+        return [(shadow, shadow_rect), (main_text, main_rect)]
 
     def get_selected_difficulty(self):
         """Get selected difficulty settings"""
@@ -25,11 +25,16 @@ class ResultScreen:
         self.stat_font = pygame.font.Font(None, 48)
         self.label_font = pygame.font.Font(None, 36)
         self.instruction_font = pygame.font.Font(None, 32)
+        self.breakdown_font = pygame.font.Font(None, 32)
 
         # State
         self.should_retry = False
         self.should_menu = False
 
+        # Final stats never change while the screen is shown: rendered on
+        # the first frame after reset() and blitted from here afterwards
+        self._blit_list = None
+
     def handle_events(self, events):
         """
         Handle result screen input
@@ -55,10 +60,24 @@ class ResultScreen:
         # Background
         self.screen.fill(COLOR_BG)
 
+        if self._blit_list is None:
+            self._blit_list = self._build_blits(score_manager, difficulty_name)
+        self.screen.blits(self._blit_list, doreturn=False)
+
+    def _build_blits(self, score_manager, difficulty_name):
+        """
+        Render every text surface of the result screen
+
+        Args:
+            score_manager: ScoreManager instance with final stats
+            difficulty_name: Name of difficulty played
+
+        Returns:
+            List of (surface, rect) pairs in draw order
+        """
         # Title
         title = self.title_font.render("GAME OVER", True, COLOR_WHITE)
-        title_rect = title.get_rect(center=(SCREEN_WIDTH // 2, 80))
-        self.screen.blit(title, title_rect)
+        blits = [(title, title.get_rect(center=(SCREEN_WIDTH // 2, 80)))]
 
         # Rank
         stats = score_manager.get_stats_dict()
@@ -66,53 +85,50 @@ class ResultScreen:
         rank_color = self._get_rank_color(rank)
 
         rank_text = self.rank_font.render(f"RANK: {rank}", True, rank_color)
-        rank_rect = rank_text.get_rect(center=(SCREEN_WIDTH // 2, 180))
-        self.screen.blit(rank_text, rank_rect)
+        blits.append((rank_text, rank_text.get_rect(center=(SCREEN_WIDTH // 2, 180))))
 
         # Statistics
-        self._render_statistics(stats, difficulty_name)
+        self._render_statistics(blits, stats, difficulty_name)
 
         # Instructions
-        self._render_instructions()
+        self._render_instructions(blits)
 
-    def _render_statistics(self, stats, difficulty_name):
-        """Render detailed statistics"""
+        return blits
+
+    def _render_statistics(self, blits, stats, difficulty_name):
+        """Render detailed statistics into the blit list"""
         y_start = 300
         y_spacing = 60
 
         # Difficulty
-        self._render_stat_line("Difficulty", difficulty_name, y_start, COLOR_WHITE)
+        self._render_stat_line(blits, "Difficulty", difficulty_name, y_start, COLOR_WHITE)
 
         # Score
-        self._render_stat_line("Score", f"{stats['score']}", y_start + y_spacing, COLOR_SCORE)
+        self._render_stat_line(blits, "Score", f"{stats['score']}", y_start + y_spacing, COLOR_SCORE)
 
         # Accuracy
         accuracy_color = self._get_accuracy_color(stats['accuracy'])
-        self._render_stat_line("Accuracy", f"{stats['accuracy']:.1f}%", y_start + y_spacing * 2, accuracy_color)
+        self._render_stat_line(blits, "Accuracy", f"{stats['accuracy']:.1f}%", y_start + y_spacing * 2, accuracy_color)
 
         # Max Combo
-        self._render_stat_line("Max Combo", f"{stats['max_combo']}x", y_start + y_spacing * 3, (241, 196, 15))
+        self._render_stat_line(blits, "Max Combo", f"{stats['max_combo']}x", y_start + y_spacing * 3, (241, 196, 15))
 
         # Hit breakdown
         breakdown_y = y_start + y_spacing * 4.5
-        self._render_hit_breakdown(stats, breakdown_y)
+        self._render_hit_breakdown(blits, stats, breakdown_y)
 
-    def _render_stat_line(self, label, value, y, color):
-        """Render a single stat line"""
+    def _render_stat_line(self, blits, label, value, y, color):
+        """Render a single stat line into the blit list"""
         # Label (left aligned)
         label_text = self.label_font.render(f"{label}:", True, (200, 200, 200))
-        label_rect = label_text.get_rect(midright=(SCREEN_WIDTH // 2 - 20, y))
-        self.screen.blit(label_text, label_rect)
+        blits.append((label_text, label_text.get_rect(midright=(SCREEN_WIDTH // 2 - 20, y))))
 
         # Value (right aligned)
         value_text = self.stat_font.render(str(value), True, color)
-        value_rect = value_text.get_rect(midleft=(SCREEN_WIDTH // 2 + 20, y))
-        self.screen.blit(value_text, value_rect)
-
-    def _render_hit_breakdown(self, stats, y):
-        """Render hit type breakdown"""
-        breakdown_font = pygame.font.Font(None, 32)
+        blits.append((value_text, value_text.get_rect(midleft=(SCREEN_WIDTH // 2 + 20, y))))
 
+    def _render_hit_breakdown(self, blits, stats, y):
+        """Render hit type breakdown into the blit list"""
         breakdown_text = (
             f"Perfect: {stats['perfect']}  |  "
             f"Good: {stats['good']}  |  "
@@ -120,12 +136,11 @@ class ResultScreen:
             f"Miss: {stats['miss']}"
         )
 
-        text = breakdown_font.render(breakdown_text, True, (180, 180, 180))
-        text_rect = text.get_rect(center=(SCREEN_WIDTH // 2, y))
-        self.screen.blit(text, text_rect)
+        text = self.breakdown_font.render(breakdown_text, True, (180, 180, 180))
+        blits.append((text, text.get_rect(center=(SCREEN_WIDTH // 2, y))))
 
-    def _render_instructions(self):
-        """Render bottom instructions"""
+    def _render_instructions(self, blits):
+        """Render bottom instructions into the blit list"""
         y = SCREEN_HEIGHT - 100
 
         instruction_lines = [
@@ -135,8 +150,7 @@ class ResultScreen:
 
         for i, line in enumerate(instruction_lines):
             text = self.instruction_font.render(line, True, (150, 150, 150))
-            text_rect = text.get_rect(center=(SCREEN_WIDTH // 2, y + i * 35))
-            self.screen.blit(text, text_rect)
+            blits.append((text, text.get_rect(center=(SCREEN_WIDTH // 2, y + i * 35))))
 
     def _get_rank_color(self, rank):
         """Get color for rank"""
@@ -174,3 +188,4 @@ class ResultScreen:
         """Reset result screen state"""
         self.should_retry = False
         self.should_menu = False
+        self._blit_list = None